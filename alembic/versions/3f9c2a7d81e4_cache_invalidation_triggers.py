@@ -0,0 +1,56 @@
+"""Cache invalidation triggers
+
+Revision ID: 3f9c2a7d81e4
+Revises: 72241aa413d6
+Create Date: 2026-10-18 12:05:41.512907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d81e4'
+down_revision: Union[str, None] = '72241aa413d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            PERFORM pg_notify('cache_invalidation', json_build_object('table', TG_TABLE_NAME, 'key', NULL)::text);
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM pg_notify('cache_invalidation', json_build_object('table', TG_TABLE_NAME, 'key', to_jsonb(OLD) ->> TG_ARGV[0])::text);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM pg_notify('cache_invalidation', json_build_object('table', TG_TABLE_NAME, 'key', to_jsonb(NEW) ->> TG_ARGV[0])::text);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    for table, key in (('employee', 'username'), ('organization_responsible', 'user_id')):
+        op.execute(f"""
+        CREATE TRIGGER {table}_cache_invalidation
+        AFTER INSERT OR UPDATE OR DELETE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation('{key}');
+        """)
+        op.execute(f"""
+        CREATE TRIGGER {table}_cache_invalidation_truncate
+        AFTER TRUNCATE ON {table}
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation('{key}');
+        """)
+
+
+def downgrade() -> None:
+    for table in ('organization_responsible', 'employee'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_cache_invalidation_truncate ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_cache_invalidation ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_cache_invalidation()")
@@ -0,0 +1,121 @@
+"""Partition archive tables
+
+Revision ID: 5d2e8b41c7a3
+Revises: a84d1c6e59b2
+Create Date: 2026-10-18 14:02:37.518640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8b41c7a3'
+down_revision: Union[str, None] = 'a84d1c6e59b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITIONS_AHEAD = 2
+
+ARCHIVES = {
+    'tenders_archives': {
+        'columns': ['archive_id', 'id', 'name', 'description', 'status', 'service_type', 'version',
+                    'organization_id', 'creator_username', 'created_at', 'updated_at'],
+        'foreign_keys': ['FOREIGN KEY (creator_username) REFERENCES employee (username)',
+                         'FOREIGN KEY (organization_id) REFERENCES organization (id)'],
+    },
+    'bids_archives': {
+        'columns': ['archive_id', 'id', 'name', 'description', 'status', 'tender_id', 'author_type', 'author_id',
+                    'version', 'decision_status', 'created_at', 'updated_at'],
+        'foreign_keys': ['FOREIGN KEY (tender_id) REFERENCES tenders (id)'],
+    },
+}
+
+
+def upgrade() -> None:
+    # Месячная секция создается пустой, строки из DEFAULT-секции за этот месяц переносятся в нее до ATTACH
+    op.execute("""
+    CREATE OR REPLACE FUNCTION ensure_archive_partition(parent text, month timestamp) RETURNS text AS $$
+    DECLARE
+        start_at timestamp := date_trunc('month', month);
+        end_at timestamp := date_trunc('month', month) + interval '1 month';
+        partition text := format('%s_p%s', parent, to_char(start_at, 'YYYYMM'));
+    BEGIN
+        IF to_regclass(partition) IS NOT NULL THEN
+            RETURN partition;
+        END IF;
+
+        EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS)', partition, parent);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM %I WHERE archived_at >= %L AND archived_at < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            parent || '_default', start_at, end_at, partition);
+        EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                       parent, partition, start_at, end_at);
+        RETURN partition;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    for table, archive in ARCHIVES.items():
+        legacy = f'{table}_legacy'
+        op.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+        op.execute(f'ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey')
+        for index in (f'ix_{table}_archive_id', f'ix_{table}_id', f'ix_{table}_id_version'):
+            op.execute(f'ALTER INDEX IF EXISTS {index} RENAME TO {index}_legacy')
+
+        op.execute(f"""
+        CREATE TABLE {table} (
+            LIKE {legacy} INCLUDING DEFAULTS,
+            archived_at TIMESTAMP NOT NULL DEFAULT now(),
+            CONSTRAINT {table}_pkey PRIMARY KEY (archive_id, archived_at),
+            {', '.join(archive['foreign_keys'])}
+        ) PARTITION BY RANGE (archived_at)
+        """)
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+        op.execute(f"""
+        SELECT ensure_archive_partition('{table}', month)
+        FROM generate_series(
+            date_trunc('month', COALESCE((SELECT min(updated_at) FROM {legacy}), now())),
+            date_trunc('month', now()) + interval '{PARTITIONS_AHEAD} month',
+            interval '1 month'
+        ) AS month
+        """)
+
+        # Время архивации старых строк неизвестно, ближайшая оценка - время их последнего изменения
+        columns = ', '.join(archive['columns'])
+        op.execute(f'INSERT INTO {table} ({columns}, archived_at) SELECT {columns}, updated_at FROM {legacy}')
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
+        op.create_index(f'ix_{table}_id_version', table, ['id', 'version'], unique=False)
+        op.execute(f'DROP TABLE {legacy}')
+        op.execute(f'ANALYZE {table}')
+
+
+def downgrade() -> None:
+    for table, archive in ARCHIVES.items():
+        partitioned = f'{table}_partitioned'
+        op.execute(f'ALTER TABLE {table} RENAME TO {partitioned}')
+        op.execute(f'ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey')
+        for index in (f'ix_{table}_id', f'ix_{table}_id_version'):
+            op.execute(f'ALTER INDEX {index} RENAME TO {index}_partitioned')
+
+        op.execute(f"""
+        CREATE TABLE {table} (
+            LIKE {partitioned} INCLUDING DEFAULTS,
+            CONSTRAINT {table}_pkey PRIMARY KEY (archive_id),
+            {', '.join(archive['foreign_keys'])}
+        )
+        """)
+        op.execute(f'ALTER TABLE {table} DROP COLUMN archived_at')
+        columns = ', '.join(archive['columns'])
+        op.execute(f'INSERT INTO {table} ({columns}) SELECT DISTINCT ON (archive_id) {columns} FROM {partitioned}')
+        op.create_index(f'ix_{table}_archive_id', table, ['archive_id'], unique=True)
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
+        op.create_index(f'ix_{table}_id_version', table, ['id', 'version'], unique=False)
+        op.execute(f'DROP TABLE {partitioned}')
+
+    op.execute('DROP FUNCTION IF EXISTS ensure_archive_partition(text, timestamp)')
+
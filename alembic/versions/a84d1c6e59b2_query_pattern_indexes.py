@@ -0,0 +1,47 @@
+"""Query pattern indexes
+
+Revision ID: a84d1c6e59b2
+Revises: 3f9c2a7d81e4
+Create Date: 2026-10-18 12:41:09.374215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a84d1c6e59b2'
+down_revision: Union[str, None] = '3f9c2a7d81e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_tenders_status_name', 'tenders', ['status', 'name', 'id']),
+    ('ix_tenders_status_service_type_name', 'tenders', ['status', 'service_type', 'name', 'id']),
+    ('ix_tenders_organization_id_name', 'tenders', ['organization_id', 'name', 'id']),
+    ('ix_tenders_creator_username_name', 'tenders', ['creator_username', 'name', 'id']),
+    ('ix_tenders_archives_id_version', 'tenders_archives', ['id', 'version']),
+    ('ix_bids_tender_id', 'bids', ['tender_id']),
+    ('ix_bids_author_id_name', 'bids', ['author_id', 'name', 'id']),
+    ('ix_bids_status_name', 'bids', ['status', 'name', 'id']),
+    ('ix_bids_archives_id_version', 'bids_archives', ['id', 'version']),
+    ('ix_feedbacks_bid_id_created_at', 'feedbacks', ['bid_id', 'created_at']),
+    ('ix_organization_name', 'organization', ['name']),
+    ('ix_organization_responsible_user_id_organization_id', 'organization_responsible', ['user_id', 'organization_id']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False,
+                            postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,47 @@
+"""Full text search
+
+Revision ID: c71f4a9e2d58
+Revises: 5d2e8b41c7a3
+Create Date: 2026-10-18 15:21:44.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71f4a9e2d58'
+down_revision: Union[str, None] = '5d2e8b41c7a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_SQL = ("setweight(to_tsvector('russian', name), 'A') || "
+                     "setweight(to_tsvector('russian', description), 'B')")
+
+TABLES = ['tenders', 'bids']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"""
+        ALTER TABLE {table}
+        ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED NOT NULL
+        """)
+
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False,
+                            postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(f'ix_{table}_search_vector', table_name=table,
+                          postgresql_concurrently=True, if_exists=True)
+
+    for table in reversed(TABLES):
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,109 @@
+"""Tender bid stats
+
+Revision ID: e4a7b9c2f613
+Revises: c71f4a9e2d58
+Create Date: 2026-10-18 16:08:12.447930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7b9c2f613'
+down_revision: Union[str, None] = 'c71f4a9e2d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = ['created', 'published', 'canceled', 'pending', 'approved', 'rejected']
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tender_bid_stats',
+        sa.Column('tender_id', sa.UUID(), nullable=False),
+        sa.Column('bids_total', sa.Integer(), server_default='0', nullable=False),
+        *[sa.Column(counter, sa.Integer(), server_default='0', nullable=False) for counter in COUNTERS],
+        sa.Column('last_activity_at', postgresql.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(['tender_id'], ['tenders.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tender_id')
+    )
+
+    # Счетчики меняются на разность старой и новой строки, поэтому параллельные записи по одному тендеру не теряются
+    op.execute("""
+    CREATE OR REPLACE FUNCTION bump_bid_stats(tender uuid, bid_status text, decision text, delta integer)
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO tender_bid_stats AS s (tender_id, bids_total, created, published, canceled,
+                                           pending, approved, rejected, last_activity_at)
+        VALUES (tender, delta,
+                delta * (bid_status = 'Created')::int,
+                delta * (bid_status = 'Published')::int,
+                delta * (bid_status = 'Canceled')::int,
+                delta * (decision = 'Pending')::int,
+                delta * (decision = 'Approved')::int,
+                delta * (decision = 'Rejected')::int,
+                now())
+        ON CONFLICT (tender_id) DO UPDATE SET
+            bids_total = s.bids_total + EXCLUDED.bids_total,
+            created = s.created + EXCLUDED.created,
+            published = s.published + EXCLUDED.published,
+            canceled = s.canceled + EXCLUDED.canceled,
+            pending = s.pending + EXCLUDED.pending,
+            approved = s.approved + EXCLUDED.approved,
+            rejected = s.rejected + EXCLUDED.rejected,
+            last_activity_at = GREATEST(s.last_activity_at, EXCLUDED.last_activity_at);
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION apply_bid_stats() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.tender_id = NEW.tender_id AND OLD.status = NEW.status
+           AND OLD.decision_status = NEW.decision_status THEN
+            UPDATE tender_bid_stats SET last_activity_at = GREATEST(last_activity_at, now())
+            WHERE tender_id = NEW.tender_id;
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM bump_bid_stats(OLD.tender_id, OLD.status::text, OLD.decision_status::text, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM bump_bid_stats(NEW.tender_id, NEW.status::text, NEW.decision_status::text, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute('LOCK TABLE bids IN SHARE ROW EXCLUSIVE MODE')
+    op.execute("""
+    CREATE TRIGGER bids_stats
+    AFTER INSERT OR UPDATE OR DELETE ON bids
+    FOR EACH ROW EXECUTE FUNCTION apply_bid_stats();
+    """)
+    op.execute("""
+    INSERT INTO tender_bid_stats (tender_id, bids_total, created, published, canceled,
+                                  pending, approved, rejected, last_activity_at)
+    SELECT tender_id, count(*),
+           count(*) FILTER (WHERE status = 'Created'),
+           count(*) FILTER (WHERE status = 'Published'),
+           count(*) FILTER (WHERE status = 'Canceled'),
+           count(*) FILTER (WHERE decision_status = 'Pending'),
+           count(*) FILTER (WHERE decision_status = 'Approved'),
+           count(*) FILTER (WHERE decision_status = 'Rejected'),
+           max(updated_at)
+    FROM bids
+    GROUP BY tender_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS bids_stats ON bids')
+    op.execute('DROP FUNCTION IF EXISTS apply_bid_stats()')
+    op.execute('DROP FUNCTION IF EXISTS bump_bid_stats(uuid, text, text, integer)')
+    op.drop_table('tender_bid_stats')
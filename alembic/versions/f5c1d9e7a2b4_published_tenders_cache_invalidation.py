@@ -0,0 +1,56 @@
+"""Published tenders cache invalidation
+
+Revision ID: f5c1d9e7a2b4
+Revises: e4a7b9c2f613
+Create Date: 2026-10-18 18:02:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c1d9e7a2b4'
+down_revision: Union[str, None] = 'e4a7b9c2f613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Одинаковые уведомления в одной транзакции Postgres схлопывает, поэтому пакетное обновление дает одно сообщение
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notify_published_tenders() RETURNS trigger AS $$
+    DECLARE
+        affected boolean := TG_OP = 'TRUNCATE';
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            affected := affected OR OLD.status = 'Published';
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            affected := affected OR NEW.status = 'Published';
+        END IF;
+        IF affected THEN
+            PERFORM pg_notify('cache_invalidation', json_build_object('table', TG_TABLE_NAME, 'key', NULL)::text);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+    CREATE TRIGGER tenders_published_cache_invalidation
+    AFTER INSERT OR UPDATE OR DELETE ON tenders
+    FOR EACH ROW EXECUTE FUNCTION notify_published_tenders();
+    """)
+    op.execute("""
+    CREATE TRIGGER tenders_published_cache_invalidation_truncate
+    AFTER TRUNCATE ON tenders
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_published_tenders();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tenders_published_cache_invalidation_truncate ON tenders")
+    op.execute("DROP TRIGGER IF EXISTS tenders_published_cache_invalidation ON tenders")
+    op.execute("DROP FUNCTION IF EXISTS notify_published_tenders()")
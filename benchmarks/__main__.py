@@ -0,0 +1,133 @@
+"""Нагрузочный бенчмарк API тендеров и предложений.
+
+Запуск:
+    python -m benchmarks seed --tenders 20000 --bids 50000
+    python -m benchmarks run --concurrency 32 --duration 60 --output bench.json
+    python -m benchmarks compare base.json bench.json
+
+seed загружает test_data.sql и засеивает базу синтетическими данными заданного объема.
+run прогоняет взвешенную смесь запросов ко всем маршрутам роутеров тендеров и предложений
+с фиксированной конкурентностью и сохраняет p50/p95/p99, пропускную способность и число
+обращений к базе по каждому эндпоинту в JSON. По умолчанию приложение запускается
+в том же процессе; с --url нагрузка подается на уже запущенный сервер, и тогда число
+обращений к базе не измеряется. Объемы в run должны совпадать с объемами в seed.
+compare сравнивает два JSON-отчета и завершается с ошибкой при росте p95 выше порога.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Optional
+
+from benchmarks.report import summarize, format_table, compare
+from benchmarks.runner import run
+from benchmarks.scenarios import SCENARIOS, SeedData
+from benchmarks.seed import Volumes, seed_database
+from src.config import POSTGRES_DSN
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _add_volume_arguments(parser: argparse.ArgumentParser) -> None:
+    for volume in fields(Volumes):
+        parser.add_argument(f"--{volume.name}", type=int, default=volume.default)
+
+
+def _volumes(args: argparse.Namespace) -> Volumes:
+    return Volumes(**{volume.name: getattr(args, volume.name) for volume in fields(Volumes)})
+
+
+def _seed(args: argparse.Namespace) -> int:
+    asyncio.run(seed_database(POSTGRES_DSN, _volumes(args), reset=args.reset))
+    print(f"База засеяна: {_volumes(args).as_dict()}")
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    volumes = _volumes(args)
+    result = asyncio.run(run(
+        SeedData(volumes),
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        seed=args.seed,
+        url=args.url,
+    ))
+
+    report = summarize(result, {
+        "revision": _git_revision(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "mode": "http" if args.url else "in-process",
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "warmup_s": args.warmup,
+        "seed": args.seed,
+        "volumes": volumes.as_dict(),
+        "mix": {scenario.endpoint: scenario.weight for scenario in SCENARIOS},
+    })
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(format_table(report))
+    print(f"\nОтчет сохранен в {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.head, encoding="utf-8") as f:
+        head = json.load(f)
+
+    table, regressions = compare(base, head, args.threshold)
+    print(table)
+    if regressions:
+        print(f"\nРост p95 больше {args.threshold}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Нагрузочный бенчмарк API")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="Засеять базу синтетическими данными")
+    _add_volume_arguments(seed_parser)
+    seed_parser.add_argument("--reset", action="store_true", help="Удалить ранее засеянные данные")
+    seed_parser.set_defaults(handler=_seed)
+
+    run_parser = commands.add_parser("run", help="Запустить нагрузку")
+    _add_volume_arguments(run_parser)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--duration", type=float, default=30.0, help="Длительность замера, с")
+    run_parser.add_argument("--warmup", type=float, default=5.0, help="Прогрев без учета в статистике, с")
+    run_parser.add_argument("--seed", type=int, default=0, help="Зерно генератора запросов")
+    run_parser.add_argument("--url", default=None, help="Базовый URL запущенного сервера, например http://localhost:8080/api")
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.set_defaults(handler=_run)
+
+    compare_parser = commands.add_parser("compare", help="Сравнить два отчета")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="Допустимый рост p95, %%")
+    compare_parser.set_defaults(handler=_compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.runner import RunResult, Sample
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _endpoint_stats(samples: List[Sample], failures: int, elapsed: float) -> Dict[str, Any]:
+    latencies = [sample.latency * 1000 for sample in samples]
+    status_codes: Dict[str, int] = {}
+    for sample in samples:
+        status_codes[str(sample.status_code)] = status_codes.get(str(sample.status_code), 0) + 1
+
+    round_trips = [sample.round_trips for sample in samples if sample.round_trips is not None]
+    return {
+        "requests": len(samples),
+        "failures": failures,
+        "server_errors": sum(1 for sample in samples if sample.status_code >= 500),
+        "status_codes": status_codes,
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            **{f"p{p}": round(percentile(latencies, p), 3) if latencies else None for p in PERCENTILES},
+            "max": round(max(latencies), 3) if latencies else None,
+        },
+        "db_round_trips": {
+            "mean": round(sum(round_trips) / len(round_trips), 2),
+            "max": max(round_trips),
+        } if round_trips else None,
+    }
+
+
+def summarize(result: RunResult, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    endpoints = sorted(set(result.samples) | set(result.failures))
+    all_samples = [sample for samples in result.samples.values() for sample in samples]
+    return {
+        "metadata": {**metadata, "elapsed_s": round(result.elapsed, 3)},
+        "total": _endpoint_stats(all_samples, sum(result.failures.values()), result.elapsed),
+        "endpoints": {
+            endpoint: _endpoint_stats(result.samples.get(endpoint, []), result.failures.get(endpoint, 0), result.elapsed)
+            for endpoint in endpoints
+        },
+    }
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    header = f"{'endpoint':<48} {'req':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'db':>6} {'5xx':>5}"
+    lines = [header, "-" * len(header)]
+    rows = list(report["endpoints"].items()) + [("TOTAL", report["total"])]
+    for endpoint, stats in rows:
+        latency = stats["latency_ms"]
+        db = stats["db_round_trips"]["mean"] if stats["db_round_trips"] else None
+        lines.append(
+            f"{endpoint:<48} {stats['requests']:>7} {_fmt(stats['throughput_rps']):>8} "
+            f"{_fmt(latency['p50']):>8} {_fmt(latency['p95']):>8} {_fmt(latency['p99']):>8} "
+            f"{_fmt(db):>6} {stats['server_errors'] + stats['failures']:>5}"
+        )
+    return "\n".join(lines)
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float) -> Tuple[str, List[str]]:
+    header = f"{'endpoint':<48} {'p50 Δ%':>8} {'p95 Δ%':>8} {'p99 Δ%':>8} {'rps Δ%':>8} {'db Δ':>6}"
+    lines = [header, "-" * len(header)]
+    regressions = []
+
+    def delta(old, new):
+        if not old or new is None:
+            return None
+        return (new - old) / old * 100
+
+    rows = [("TOTAL", base["total"], head["total"])] + [
+        (endpoint, base["endpoints"][endpoint], stats)
+        for endpoint, stats in head["endpoints"].items() if endpoint in base["endpoints"]
+    ]
+    for endpoint, old, new in rows:
+        deltas = {p: delta(old["latency_ms"][f"p{p}"], new["latency_ms"][f"p{p}"]) for p in PERCENTILES}
+        rps = delta(old["throughput_rps"], new["throughput_rps"])
+        db = None
+        if old["db_round_trips"] and new["db_round_trips"]:
+            db = new["db_round_trips"]["mean"] - old["db_round_trips"]["mean"]
+
+        if deltas[95] is not None and deltas[95] > threshold:
+            regressions.append(endpoint)
+        lines.append(
+            f"{endpoint:<48} {_fmt(deltas[50]):>8} {_fmt(deltas[95]):>8} {_fmt(deltas[99]):>8} "
+            f"{_fmt(rps):>8} {_fmt(db):>6}"
+        )
+    return "\n".join(lines), regressions
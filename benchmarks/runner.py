@@ -0,0 +1,115 @@
+import asyncio
+import random
+import time
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.scenarios import SCENARIOS, Scenario, SeedData
+from src.utils.query_budget import queries_from_headers
+
+_round_trips: ContextVar[Optional[List[int]]] = ContextVar("bench_round_trips", default=None)
+
+
+def _count_round_trip(*_):
+    counter = _round_trips.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@dataclass
+class Sample:
+    latency: float
+    status_code: int
+    round_trips: Optional[int]
+
+
+@dataclass
+class RunResult:
+    samples: Dict[str, List[Sample]] = field(default_factory=dict)
+    failures: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+async def _worker(
+        client: httpx.AsyncClient,
+        data: SeedData,
+        rng: random.Random,
+        result: RunResult,
+        deadline: float,
+        warmup_until: float,
+        in_process: bool
+):
+    weights = [scenario.weight for scenario in SCENARIOS]
+    while True:
+        started = time.perf_counter()
+        if started >= deadline:
+            return
+
+        scenario: Scenario = rng.choices(SCENARIOS, weights)[0]
+        call = scenario.build(data, rng)
+
+        counter = [0]
+        token = _round_trips.set(counter)
+        try:
+            response = await client.request(call.method, call.path, params=call.params, json=call.json,
+                                            content=call.content)
+        except httpx.HTTPError:
+            if started >= warmup_until:
+                result.failures[scenario.endpoint] = result.failures.get(scenario.endpoint, 0) + 1
+            continue
+        finally:
+            _round_trips.reset(token)
+        latency = time.perf_counter() - started
+
+        if started >= warmup_until:
+            round_trips = counter[0] if in_process else queries_from_headers(response.headers)
+            result.samples.setdefault(scenario.endpoint, []).append(
+                Sample(latency, response.status_code, round_trips))
+
+
+async def run(
+        data: SeedData,
+        concurrency: int,
+        duration: float,
+        warmup: float,
+        seed: int,
+        url: Optional[str] = None,
+        timeout: float = 30.0
+) -> RunResult:
+    result = RunResult()
+
+    async with AsyncExitStack() as stack:
+        if url is None:
+            from src.database import engine, read_engine
+            from src.main import app
+
+            for counted in {engine, read_engine}:
+                event.listen(counted.sync_engine, "before_cursor_execute", _count_round_trip)
+                stack.callback(event.remove, counted.sync_engine, "before_cursor_execute", _count_round_trip)
+                stack.push_async_callback(counted.dispose)
+            await stack.enter_async_context(app.router.lifespan_context(app))
+
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            base_url = "http://bench/api"
+        else:
+            transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=concurrency))
+            base_url = url.rstrip("/")
+
+        client = await stack.enter_async_context(
+            httpx.AsyncClient(transport=transport, base_url=base_url, timeout=timeout))
+
+        started = time.perf_counter()
+        warmup_until = started + warmup
+        deadline = warmup_until + duration
+        await asyncio.gather(*(
+            _worker(client, data, random.Random(seed + n), result, deadline, warmup_until, url is None)
+            for n in range(concurrency)
+        ))
+        result.elapsed = time.perf_counter() - warmup_until
+
+    return result
@@ -0,0 +1,313 @@
+import hashlib
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.seed import Volumes
+from scripts.seed import seed_uuid, seed_username
+
+
+@dataclass
+class Call:
+    method: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    json: Optional[Any] = None
+    content: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    endpoint: str
+    weight: float
+    build: Callable[["SeedData", random.Random], Call]
+
+
+class SeedData:
+    """Зеркалирует формулы из scripts/seed.py, чтобы выбирать связанные сущности без запросов к базе."""
+
+    def __init__(self, volumes: Volumes):
+        self.volumes = volumes
+
+    def employee(self, rng: random.Random) -> int:
+        return rng.randint(1, self.volumes.employees)
+
+    def organization_of(self, employee: int) -> int:
+        return 1 + employee % self.volumes.organizations
+
+    def tender(self, rng: random.Random) -> int:
+        return rng.randint(1, self.volumes.tenders)
+
+    def tender_creator(self, tender: int) -> int:
+        return 1 + tender % self.volumes.employees
+
+    def tenders_of(self, employee: int, count: int) -> List[int]:
+        return list(range(employee - 1 or self.volumes.employees, self.volumes.tenders + 1, self.volumes.employees))[:count]
+
+    def versioned_tender(self, rng: random.Random) -> int:
+        while True:
+            tender = self.tender(rng)
+            if tender % self.volumes.versions:
+                return tender
+
+    def user_bid(self, rng: random.Random) -> int:
+        while True:
+            bid = rng.randint(1, self.volumes.bids)
+            if bid % 4:
+                return bid
+
+    def versioned_user_bid(self, rng: random.Random) -> int:
+        while True:
+            bid = self.user_bid(rng)
+            if bid % self.volumes.versions:
+                return bid
+
+    def bid_author(self, bid: int) -> int:
+        return 1 + bid % self.volumes.employees
+
+    def bid_tender(self, bid: int) -> int:
+        return 1 + bid % self.volumes.tenders
+
+
+SERVICE_TYPES = ["Construction", "Delivery", "Manufacture"]
+TENDER_STATUSES = ["Created", "Published", "Closed"]
+BID_STATUSES = ["Created", "Published", "Canceled"]
+DECISIONS = ["Approved", "Rejected"]
+
+
+def _tender_payload(data: SeedData, rng: random.Random, employee: int) -> Dict[str, Any]:
+    return {
+        "name": f"Bench tender {rng.getrandbits(32):08x}",
+        "description": "Benchmark tender",
+        "service_type": rng.choice(SERVICE_TYPES),
+        "organization_id": str(seed_uuid("organization", data.organization_of(employee))),
+        "creator_username": seed_username(employee),
+    }
+
+
+def _bid_payload(data: SeedData, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "name": f"Bench bid {rng.getrandbits(32):08x}",
+        "description": "Benchmark bid",
+        "tender_id": str(seed_uuid("tender", data.tender(rng))),
+        "author_type": "User",
+        "author_id": str(seed_uuid("employee", data.employee(rng))),
+    }
+
+
+def _get_tenders(data: SeedData, rng: random.Random) -> Call:
+    params = {"limit": rng.choice([5, 20, 50]), "offset": rng.choice([0, 0, 0, 20, 100])}
+    if rng.random() < 0.5:
+        params["service_type"] = rng.sample(SERVICE_TYPES, rng.randint(1, 2))
+    return Call("GET", "/tenders", params)
+
+
+def _search_tenders(data: SeedData, rng: random.Random) -> Call:
+    # Названия засеянных тендеров содержат md5, поэтому поиск по нему находит ровно одну запись
+    query = hashlib.md5(f"seed_tender_name{data.tender(rng)}".encode()).hexdigest()
+    return Call("GET", "/tenders", {"q": query, "limit": 20})
+
+
+def _create_tender(data: SeedData, rng: random.Random) -> Call:
+    return Call("POST", "/tenders/new", json=_tender_payload(data, rng, data.employee(rng)))
+
+
+def _create_tenders_bulk(data: SeedData, rng: random.Random) -> Call:
+    employee = data.employee(rng)
+    return Call("POST", "/tenders/bulk", json={"tenders": [_tender_payload(data, rng, employee) for _ in range(20)]})
+
+
+def _edit_tenders_status_bulk(data: SeedData, rng: random.Random) -> Call:
+    employee = data.employee(rng)
+    tender_ids = [str(seed_uuid("tender", tender)) for tender in data.tenders_of(employee, 20)]
+    return Call("PATCH", "/tenders/bulk/status", {"username": seed_username(employee)},
+                json={"tender_ids": tender_ids, "status": rng.choice(TENDER_STATUSES)})
+
+
+def _export_tenders(data: SeedData, rng: random.Random) -> Call:
+    employee = data.employee(rng)
+    return Call("GET", "/tenders/export", {
+        "organization_id": str(seed_uuid("organization", data.organization_of(employee))),
+        "username": seed_username(employee),
+        "format": rng.choice(["ndjson", "csv"]),
+    })
+
+
+def _import_tenders(data: SeedData, rng: random.Random) -> Call:
+    rows = [json.dumps(_tender_payload(data, rng, data.employee(rng))) for _ in range(20)]
+    return Call("POST", "/tenders/import", {"format": "ndjson"}, content="\n".join(rows))
+
+
+def _get_my_tenders(data: SeedData, rng: random.Random) -> Call:
+    return Call("GET", "/tenders/my", {
+        "username": seed_username(data.employee(rng)),
+        "query_type": rng.choice(["author", "responsible"]),
+        "limit": rng.choice([5, 20]),
+    })
+
+
+def _get_tender_status(data: SeedData, rng: random.Random) -> Call:
+    tender = data.tender(rng)
+    return Call("GET", f"/tenders/{seed_uuid('tender', tender)}/status",
+                {"username": seed_username(data.tender_creator(tender))})
+
+
+def _get_tender_stats(data: SeedData, rng: random.Random) -> Call:
+    tender = data.tender(rng)
+    return Call("GET", f"/tenders/{seed_uuid('tender', tender)}/stats",
+                {"username": seed_username(data.tender_creator(tender))})
+
+
+def _edit_tender_status(data: SeedData, rng: random.Random) -> Call:
+    tender = data.tender(rng)
+    return Call("PATCH", f"/tenders/{seed_uuid('tender', tender)}/status", {
+        "username": seed_username(data.tender_creator(tender)),
+        "new_status": rng.choice(TENDER_STATUSES),
+    })
+
+
+def _edit_tender(data: SeedData, rng: random.Random) -> Call:
+    tender = data.tender(rng)
+    return Call("PATCH", f"/tenders/{seed_uuid('tender', tender)}/edit",
+                {"username": seed_username(data.tender_creator(tender))},
+                json={"description": f"Benchmark edit {rng.getrandbits(32):08x}"})
+
+
+def _rollback_tender(data: SeedData, rng: random.Random) -> Call:
+    tender = data.versioned_tender(rng)
+    return Call("PUT", f"/tenders/{seed_uuid('tender', tender)}/rollback/1",
+                {"username": seed_username(data.tender_creator(tender))})
+
+
+def _get_tender_versions(data: SeedData, rng: random.Random) -> Call:
+    tender = data.tender(rng)
+    return Call("GET", f"/tenders/{seed_uuid('tender', tender)}/versions",
+                {"username": seed_username(data.tender_creator(tender)), "limit": 5})
+
+
+def _get_tender_versions_diff(data: SeedData, rng: random.Random) -> Call:
+    tender = data.versioned_tender(rng)
+    return Call("GET", f"/tenders/{seed_uuid('tender', tender)}/versions/diff",
+                {"username": seed_username(data.tender_creator(tender)), "version_from": 1})
+
+
+def _create_bid(data: SeedData, rng: random.Random) -> Call:
+    return Call("POST", "/bids/new", json=_bid_payload(data, rng))
+
+
+def _create_bids_bulk(data: SeedData, rng: random.Random) -> Call:
+    return Call("POST", "/bids/bulk", json={"bids": [_bid_payload(data, rng) for _ in range(20)]})
+
+
+def _get_my_bids(data: SeedData, rng: random.Random) -> Call:
+    return Call("GET", "/bids/my", {"username": seed_username(data.employee(rng)), "limit": rng.choice([5, 20])})
+
+
+def _export_bids(data: SeedData, rng: random.Random) -> Call:
+    employee = data.employee(rng)
+    return Call("GET", "/bids/export", {
+        "organization_id": str(seed_uuid("organization", data.organization_of(employee))),
+        "username": seed_username(employee),
+        "format": rng.choice(["ndjson", "csv"]),
+    })
+
+
+def _get_list_bids(data: SeedData, rng: random.Random) -> Call:
+    tender = data.tender(rng)
+    return Call("GET", f"/bids/{seed_uuid('tender', tender)}/list",
+                {"username": seed_username(data.tender_creator(tender)), "limit": rng.choice([5, 20])})
+
+
+def _get_bid_status(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    return Call("GET", f"/bids/{seed_uuid('bid', bid)}/status", {"username": seed_username(data.bid_author(bid))})
+
+
+def _edit_bid_status(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    return Call("PATCH", f"/bids/{seed_uuid('bid', bid)}/status", {
+        "username": seed_username(data.bid_author(bid)),
+        "new_status": rng.choice(BID_STATUSES),
+    })
+
+
+def _edit_bid(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    return Call("PATCH", f"/bids/{seed_uuid('bid', bid)}/edit", {"username": seed_username(data.bid_author(bid))},
+                json={"description": f"Benchmark edit {rng.getrandbits(32):08x}"})
+
+
+def _rollback_bid(data: SeedData, rng: random.Random) -> Call:
+    bid = data.versioned_user_bid(rng)
+    return Call("PUT", f"/bids/{seed_uuid('bid', bid)}/rollback/1", {"username": seed_username(data.bid_author(bid))})
+
+
+def _get_bid_versions(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    return Call("GET", f"/bids/{seed_uuid('bid', bid)}/versions", {"username": seed_username(data.bid_author(bid))})
+
+
+def _get_bid_versions_diff(data: SeedData, rng: random.Random) -> Call:
+    bid = data.versioned_user_bid(rng)
+    return Call("GET", f"/bids/{seed_uuid('bid', bid)}/versions/diff",
+                {"username": seed_username(data.bid_author(bid)), "version_from": 1})
+
+
+def _submit_decision(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    return Call("PATCH", f"/bids/{seed_uuid('bid', bid)}/submit_decision", {
+        "username": seed_username(data.tender_creator(data.bid_tender(bid))),
+        "decision": rng.choice(DECISIONS),
+    })
+
+
+def _send_feedback(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    return Call("POST", f"/bids/{seed_uuid('bid', bid)}/feedback", {
+        "username": seed_username(data.tender_creator(data.bid_tender(bid))),
+        "bid_feedback": "Benchmark feedback",
+    })
+
+
+def _get_reviews(data: SeedData, rng: random.Random) -> Call:
+    bid = data.user_bid(rng)
+    tender = data.bid_tender(bid)
+    return Call("GET", f"/bids/{seed_uuid('tender', tender)}/reviews", {
+        "author_username_or_organization_name": seed_username(data.bid_author(bid)),
+        "request_username": seed_username(data.tender_creator(tender)),
+        "limit": 5,
+    })
+
+
+SCENARIOS: Tuple[Scenario, ...] = (
+    Scenario("GET /tenders", 20, _get_tenders),
+    Scenario("GET /tenders?q", 4, _search_tenders),
+    Scenario("POST /tenders/new", 2, _create_tender),
+    Scenario("POST /tenders/bulk", 0.5, _create_tenders_bulk),
+    Scenario("PATCH /tenders/bulk/status", 0.5, _edit_tenders_status_bulk),
+    Scenario("POST /tenders/import", 0.2, _import_tenders),
+    Scenario("GET /tenders/my", 10, _get_my_tenders),
+    Scenario("GET /tenders/export", 0.2, _export_tenders),
+    Scenario("GET /tenders/{tender_id}/status", 10, _get_tender_status),
+    Scenario("GET /tenders/{tender_id}/stats", 4, _get_tender_stats),
+    Scenario("PATCH /tenders/{tender_id}/status", 2, _edit_tender_status),
+    Scenario("PATCH /tenders/{tender_id}/edit", 3, _edit_tender),
+    Scenario("PUT /tenders/{tender_id}/rollback/{version}", 1, _rollback_tender),
+    Scenario("GET /tenders/{tender_id}/versions", 2, _get_tender_versions),
+    Scenario("GET /tenders/{tender_id}/versions/diff", 1, _get_tender_versions_diff),
+    Scenario("POST /bids/new", 3, _create_bid),
+    Scenario("POST /bids/bulk", 0.5, _create_bids_bulk),
+    Scenario("GET /bids/my", 10, _get_my_bids),
+    Scenario("GET /bids/export", 0.2, _export_bids),
+    Scenario("GET /bids/{tender_id}/list", 8, _get_list_bids),
+    Scenario("GET /bids/{bid_id}/status", 8, _get_bid_status),
+    Scenario("PATCH /bids/{bid_id}/status", 2, _edit_bid_status),
+    Scenario("PATCH /bids/{bid_id}/edit", 2, _edit_bid),
+    Scenario("PUT /bids/{bid_id}/rollback/{version}", 1, _rollback_bid),
+    Scenario("GET /bids/{bid_id}/versions", 2, _get_bid_versions),
+    Scenario("GET /bids/{bid_id}/versions/diff", 1, _get_bid_versions_diff),
+    Scenario("PATCH /bids/{bid_id}/submit_decision", 2, _submit_decision),
+    Scenario("POST /bids/{bid_id}/feedback", 2, _send_feedback),
+    Scenario("GET /bids/{tender_id}/reviews", 4, _get_reviews),
+)
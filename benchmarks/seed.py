@@ -0,0 +1,54 @@
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import asyncpg
+
+from scripts.seed import seed
+
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "test_data.sql"
+
+RESET_SQL = """
+DELETE FROM feedbacks
+WHERE bid_id IN (SELECT b.id FROM bids b JOIN tenders t ON t.id = b.tender_id
+                 WHERE t.creator_username LIKE 'seed\\_user\\_%');
+DELETE FROM bids_archives
+WHERE tender_id IN (SELECT id FROM tenders WHERE creator_username LIKE 'seed\\_user\\_%');
+DELETE FROM bids
+WHERE tender_id IN (SELECT id FROM tenders WHERE creator_username LIKE 'seed\\_user\\_%');
+DELETE FROM tenders_archives WHERE creator_username LIKE 'seed\\_user\\_%';
+DELETE FROM tenders WHERE creator_username LIKE 'seed\\_user\\_%';
+DELETE FROM organization_responsible
+WHERE user_id IN (SELECT id FROM employee WHERE username LIKE 'seed\\_user\\_%');
+DELETE FROM organization WHERE name LIKE 'seed\\_org\\_%';
+DELETE FROM employee WHERE username LIKE 'seed\\_user\\_%';
+"""
+
+
+@dataclass(frozen=True)
+class Volumes:
+    employees: int = 1000
+    organizations: int = 100
+    tenders: int = 20000
+    bids: int = 50000
+    feedbacks: int = 20000
+    versions: int = 5
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+async def seed_database(dsn: str, volumes: Volumes, reset: bool = False) -> None:
+    connection = await asyncpg.connect(dsn)
+    try:
+        async with connection.transaction():
+            if not await connection.fetchval("SELECT 1 FROM employee WHERE username = 'Kirill'"):
+                await connection.execute(TEST_DATA_PATH.read_text(encoding="utf-8"))
+
+            if await connection.fetchval("SELECT 1 FROM employee WHERE username = 'seed_user_1'"):
+                if not reset:
+                    raise RuntimeError("База уже засеяна, для пересева используйте --reset")
+                await connection.execute(RESET_SQL)
+
+            await seed(connection, **volumes.as_dict())
+    finally:
+        await connection.close()
@@ -0,0 +1,104 @@
+"""Микробенчмарк сериализации страниц списка тендеров.
+
+Запуск:
+    python -m benchmarks.serialization --sizes 5 20 50 100 --repeat 300
+
+Сравнивает прежний путь FastAPI (ORM-объекты, проверка по response_model, jsonable_encoder
+и JSONResponse) с json_response из src.utils.serialization для ORM-объектов и для строк
+.mappings(). База данных не нужна: строки создаются в памяти, время выводится в
+микросекундах на страницу (медиана по повторам).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.tenders.models import Tender as TenderModel
+from src.tenders.schemas import Tender
+from src.utils.serialization import json_response
+
+SIZES = (5, 20, 50, 100)
+
+
+def make_rows(size: int) -> List[Dict[str, Any]]:
+    now = datetime.now()
+    return [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Тендер {index}",
+            "description": "Нужно доставить оборудование для олимпиады по робототехнике",
+            "status": "Published",
+            "service_type": "Delivery",
+            "version": 1 + index % 5,
+            "organization_id": uuid.uuid4(),
+            "creator_username": f"user{index}",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(size)
+    ]
+
+
+async def _measure(render: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await render()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1_000_000
+
+
+async def bench(sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    field = create_model_field(name="Response_get_tenders", type_=List[Tender], mode="serialization")
+    results = []
+    for size in sizes:
+        rows = make_rows(size)
+        orm_rows = [TenderModel(**row) for row in rows]
+
+        async def fastapi_path():
+            content = await serialize_response(field=field, response_content=orm_rows)
+            return JSONResponse(content).body
+
+        async def fast_orm():
+            return json_response(List[Tender], orm_rows).body
+
+        async def fast_mappings():
+            return json_response(List[Tender], rows).body
+
+        baseline = await _measure(fastapi_path, repeat)
+        orm = await _measure(fast_orm, repeat)
+        mappings = await _measure(fast_mappings, repeat)
+        results.append({
+            "size": size,
+            "fastapi_us": round(baseline, 1),
+            "fast_orm_us": round(orm, 1),
+            "fast_mappings_us": round(mappings, 1),
+            "speedup": round(baseline / mappings, 2) if mappings else None,
+        })
+    return results
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    header = f"{'size':>6} {'fastapi, мкс':>14} {'fast orm, мкс':>14} {'fast mappings, мкс':>19} {'ускорение':>10}"
+    lines = [header, "-" * len(header)]
+    for row in results:
+        lines.append(
+            f"{row['size']:>6} {row['fastapi_us']:>14} {row['fast_orm_us']:>14} "
+            f"{row['fast_mappings_us']:>19} {row['speedup']:>9}x"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Микробенчмарк сериализации ответов")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+    print(format_results(asyncio.run(bench(args.sizes, args.repeat))))
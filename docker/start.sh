@@ -2,4 +2,8 @@
 
 alembic upgrade head
 
-exec uvicorn src.main:app --host 0.0.0.0 --port 8080 --workers 4
\ No newline at end of file
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+exec uvicorn src.main:app --host 0.0.0.0 --port 8080 --workers ${UVICORN_WORKERS:-4}
\ No newline at end of file
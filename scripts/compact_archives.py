@@ -0,0 +1,50 @@
+"""Разовая компакция архивных таблиц по политике хранения.
+
+Запуск: python -m scripts.compact_archives [--keep-versions N] [--keep-days N]
+
+Создает секции архивов на текущий и следующие месяцы, удаляет архивные версии вне
+политики хранения и удаляет пустые и полностью устаревшие секции. Без аргументов
+используются значения ARCHIVE_* из окружения. Подходит для запуска по cron, когда
+фоновая компакция в приложении отключена (ARCHIVE_COMPACTION_INTERVAL=0).
+"""
+import argparse
+import asyncio
+import sys
+
+from src.bids.dao import BidDAO
+from src.config import ARCHIVE_KEEP_VERSIONS, ARCHIVE_KEEP_DAYS, ARCHIVE_COMPACTION_BATCH, ARCHIVE_PARTITIONS_AHEAD
+from src.database import engine
+from src.tenders.dao import TenderDAO
+from src.utils.archive_retention import ArchiveCompactor
+
+
+async def main(args: argparse.Namespace) -> int:
+    compactor = ArchiveCompactor(
+        engine,
+        tables=[dao.model_archive.__tablename__ for dao in (TenderDAO, BidDAO)],
+        keep_versions=args.keep_versions,
+        keep_days=args.keep_days,
+        interval=0,
+        batch_size=args.batch_size,
+        partitions_ahead=ARCHIVE_PARTITIONS_AHEAD,
+    )
+    try:
+        removed = await compactor.compact()
+    finally:
+        await engine.dispose()
+
+    if not removed:
+        print("Компакция уже выполняется другим процессом")
+        return 1
+
+    for table, count in removed.items():
+        print(f"{table}: удалено архивных версий {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Компакция архивных таблиц")
+    parser.add_argument("--keep-versions", type=int, default=ARCHIVE_KEEP_VERSIONS)
+    parser.add_argument("--keep-days", type=int, default=ARCHIVE_KEEP_DAYS)
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_COMPACTION_BATCH)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,151 @@
+"""Проверка планов запросов роутеров на засеянном наборе данных.
+
+Запуск: python -m scripts.explain_check
+
+Все данные засеиваются внутри одной транзакции, которая откатывается в конце,
+поэтому база остается в исходном состоянии. Для каждого запроса, который строят
+DAO в роутерах, выполняется EXPLAIN и проверяется, что план не содержит Seq Scan
+и использует хотя бы один индекс. Seq Scan по пустым секциям архивов не считается
+ошибкой: для пустой таблицы он дешевле любого индекса.
+"""
+import asyncio
+import hashlib
+import json
+import sys
+from typing import Any, Iterator, List, Tuple
+
+import asyncpg
+from sqlalchemy.dialects import postgresql
+
+from src.access.dao import AccessDAO
+from src.bids.dao import BidDAO, BidArchiveDAO, BidStatsDAO, FeedbackDAO
+from src.bids.models import BidStatus
+from src.config import POSTGRES_DSN
+from src.models.dao import EmployeeDAO, OrganizationDAO, OrganizationResponsibleDAO
+from src.tenders.dao import TenderDAO, TenderArchiveDAO
+from src.tenders.models import TenderStatus, TenderServiceType
+from scripts.seed import seed, seed_uuid, seed_username
+
+INDEX_NODES = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+EMPTY_PARTITIONS_SQL = "SELECT relname FROM pg_class WHERE relispartition AND relkind = 'r' AND reltuples = 0"
+
+
+class _EmptyResult:
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return []
+
+    def first(self):
+        return None
+
+    def one(self):
+        return 0, None, ""
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params=None, **kwargs):
+        self.statements.append(statement.params(params) if params else statement)
+        return _EmptyResult()
+
+
+async def collect_queries() -> List[Tuple[str, Any]]:
+    employee_id = seed_uuid("employee", 1)
+    organization_id = seed_uuid("organization", 2)
+    tender_id = seed_uuid("tender", 1)
+    bid_id = seed_uuid("bid", 1)
+
+    calls = [
+        ("GET /tenders", lambda s: TenderDAO.find_with_filters(
+            s, limit=5, order_by_column="name", status=TenderStatus.Published,
+            service_type=[TenderServiceType.Delivery])),
+        ("GET /tenders If-None-Match", lambda s: TenderDAO.fingerprint_with_filters(
+            s, limit=5, order_by_column="name", status=TenderStatus.Published,
+            service_type=[TenderServiceType.Delivery])),
+        ("GET /tenders?q", lambda s: TenderDAO.find_mappings_with_filters(
+            s, limit=5, order_by_column="name", status=TenderStatus.Published,
+            search=hashlib.md5(b"seed_tender_name1").hexdigest())),
+        ("GET /tenders (без фильтра)", lambda s: TenderDAO.find_with_filters(
+            s, limit=5, order_by_column="name", status=TenderStatus.Published)),
+        ("GET /tenders/my author", lambda s: TenderDAO.find_with_filters(
+            s, limit=5, order_by_column="name", creator_username=seed_username(1))),
+        ("GET /tenders/my responsible", lambda s: TenderDAO.find_with_filters(
+            s, limit=5, order_by_column="name", organization_id=[organization_id])),
+        ("GET /bids/my", lambda s: BidDAO.find_with_filters(
+            s, limit=5, order_by_column="name", author_id=employee_id)),
+        ("GET /bids/my?q", lambda s: BidDAO.find_mappings_with_filters(
+            s, limit=5, order_by_column="name", author_id=employee_id,
+            search=hashlib.md5(b"seed_bid_name1").hexdigest())),
+        ("GET /bids/{tender_id}/list", lambda s: BidDAO.find_with_filters(
+            s, limit=5, order_by_column="name", status=BidStatus.Published)),
+        ("GET /tenders/{tender_id}/stats", lambda s: BidStatsDAO.find_one(s, tender_id=tender_id)),
+        ("GET /bids/{tender_id}/reviews", lambda s: FeedbackDAO.find_by_bid_author(
+            s, author_id=employee_id, limit=5)),
+        ("tender access", lambda s: AccessDAO.resolve_tender(s, username=seed_username(1), tender_id=tender_id)),
+        ("bid access", lambda s: AccessDAO.resolve_bid(s, username=seed_username(1), bid_id=bid_id)),
+        ("employee by username", lambda s: EmployeeDAO.find_one(s, username=seed_username(1))),
+        ("organization by name", lambda s: OrganizationDAO.find_one(s, name="seed_org_1")),
+        ("responsibilities by user", lambda s: OrganizationResponsibleDAO.find_all(s, user_id=employee_id)),
+        ("tender archive version", lambda s: TenderArchiveDAO.find_one(s, id=tender_id, version=1)),
+        ("bid archive version", lambda s: BidArchiveDAO.find_one(s, id=bid_id, version=1)),
+        ("GET /tenders/{tender_id}/versions", lambda s: TenderDAO.find_versions(s, tender_id, limit=5)),
+        ("GET /bids/{bid_id}/versions", lambda s: BidDAO.find_versions(s, bid_id, limit=5)),
+    ]
+
+    queries = []
+    for name, call in calls:
+        session = RecordingSession()
+        await call(session)
+        queries.extend((name, statement) for statement in session.statements)
+    return queries
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def walk_plan(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk_plan(child)
+
+
+async def main() -> int:
+    connection = await asyncpg.connect(POSTGRES_DSN)
+    transaction = connection.transaction()
+    await transaction.start()
+    failures = 0
+    try:
+        await seed(connection)
+        empty_partitions = {row["relname"] for row in await connection.fetch(EMPTY_PARTITIONS_SQL)}
+
+        for name, statement in await collect_queries():
+            raw_plan = await connection.fetchval(f"EXPLAIN (FORMAT JSON) {compile_sql(statement)}")
+            nodes = list(walk_plan(json.loads(raw_plan)[0]["Plan"]))
+            node_types = {node["Node Type"] for node in nodes}
+            seq_scans = [
+                node.get("Relation Name") for node in nodes
+                if node["Node Type"] == "Seq Scan" and node.get("Relation Name") not in empty_partitions
+            ]
+
+            ok = not seq_scans and bool(node_types & INDEX_NODES)
+            failures += not ok
+            indexes = sorted({node["Index Name"] for node in nodes if "Index Name" in node})
+            print(f"{'OK  ' if ok else 'FAIL'} {name}: индексы={indexes} seq_scan={seq_scans}")
+    finally:
+        await transaction.rollback()
+        await connection.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,53 @@
+"""Импорт тендеров из CSV или NDJSON файла.
+
+Запуск: python -m scripts.import_tenders tenders.csv [--format csv|ndjson] [--chunk-size N]
+
+Файл читается по частям и проходит тот же путь, что и POST /tenders/import: проверка
+строк, пакетная проверка организаций и создателей, COPY во временную таблицу и один
+INSERT ... SELECT в тендеры в одной транзакции. Формат по умолчанию определяется по
+расширению файла. Код возврата 1, если хотя бы одна строка отклонена.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+
+from src.database import async_session_maker, engine
+from src.tenders.importer import import_tenders
+from src.utils.export import ExportFormat
+
+
+async def read_chunks(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, chunk_size):
+            yield chunk
+
+
+async def main(args: argparse.Namespace) -> int:
+    path = Path(args.path)
+    import_format = ExportFormat(args.format or ("ndjson" if path.suffix.lower() in (".ndjson", ".jsonl") else "csv"))
+    try:
+        async with async_session_maker() as session:
+            async with session.begin():
+                report = await import_tenders(session, read_chunks(path, args.chunk_size), import_format)
+    except HTTPException as e:
+        print(f"Импорт не выполнен: {e.detail}", file=sys.stderr)
+        return 2
+    finally:
+        await engine.dispose()
+
+    print(f"Загружено тендеров: {report.imported}, отклонено строк: {report.failed}")
+    for error in report.errors:
+        print(f"строка {error.line}: {error.error}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Импорт тендеров из файла")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=[item.value for item in ExportFormat])
+    parser.add_argument("--chunk-size", type=int, default=1 << 16)
+    sys.exit(asyncio.run(main(parser.parse_args())))
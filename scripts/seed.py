@@ -0,0 +1,89 @@
+import hashlib
+import uuid
+
+import asyncpg
+
+
+def seed_uuid(kind: str, n: int) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(f"seed_{kind}{n}".encode()).hexdigest())
+
+
+def seed_username(n: int) -> str:
+    return f"seed_user_{n}"
+
+
+SEED_SQL = """
+INSERT INTO employee (id, username, first_name, last_name)
+SELECT md5('seed_employee' || g)::uuid, 'seed_user_' || g, 'Seed', 'User'
+FROM generate_series(1, {employees}) g;
+
+INSERT INTO organization (id, name, description, type)
+SELECT md5('seed_organization' || g)::uuid, 'seed_org_' || g, 'Seed organization',
+       (ARRAY['IE', 'LLC', 'JSC'])[1 + g % 3]::organization_type
+FROM generate_series(1, {organizations}) g;
+
+INSERT INTO organization_responsible (id, organization_id, user_id)
+SELECT md5('seed_responsible' || g)::uuid, md5('seed_organization' || (1 + g % {organizations}))::uuid,
+       md5('seed_employee' || g)::uuid
+FROM generate_series(1, {employees}) g;
+
+INSERT INTO tenders (id, name, description, status, service_type, version, organization_id, creator_username)
+SELECT md5('seed_tender' || g)::uuid, 'Tender ' || md5('seed_tender_name' || g), 'Seed tender description',
+       (ARRAY['Created', 'Published', 'Closed'])[1 + g % 3]::tenderstatus,
+       (ARRAY['Construction', 'Delivery', 'Manufacture'])[1 + (g / 3) % 3]::tenderservicetype,
+       1 + g % {versions},
+       md5('seed_organization' || (1 + (1 + g % {employees}) % {organizations}))::uuid,
+       'seed_user_' || (1 + g % {employees})
+FROM generate_series(1, {tenders}) g;
+
+INSERT INTO tenders_archives (archive_id, id, name, description, status, service_type, version,
+                              organization_id, creator_username, created_at, updated_at)
+SELECT gen_random_uuid(), t.id, t.name, t.description, t.status, t.service_type, v,
+       t.organization_id, t.creator_username, t.created_at, t.updated_at
+FROM tenders t, generate_series(1, t.version - 1) v
+WHERE t.creator_username LIKE 'seed\\_user\\_%';
+
+INSERT INTO bids (id, name, description, status, tender_id, author_type, author_id, version, decision_status)
+SELECT md5('seed_bid' || g)::uuid, 'Bid ' || md5('seed_bid_name' || g), 'Seed bid description',
+       (ARRAY['Created', 'Published', 'Canceled'])[1 + g % 3]::bidstatus,
+       md5('seed_tender' || (1 + g % {tenders}))::uuid,
+       (CASE WHEN g % 4 = 0 THEN 'Organization' ELSE 'User' END)::authortype,
+       (CASE WHEN g % 4 = 0 THEN md5('seed_organization' || (1 + g % {organizations}))
+             ELSE md5('seed_employee' || (1 + g % {employees})) END)::uuid,
+       1 + g % {versions},
+       (ARRAY['Approved', 'Rejected', 'Pending'])[1 + g % 3]::decisionstatus
+FROM generate_series(1, {bids}) g;
+
+INSERT INTO bids_archives (archive_id, id, name, description, status, tender_id, author_type, author_id,
+                           version, decision_status, created_at, updated_at)
+SELECT gen_random_uuid(), b.id, b.name, b.description, b.status, b.tender_id, b.author_type, b.author_id,
+       v, b.decision_status, b.created_at, b.updated_at
+FROM bids b, generate_series(1, b.version - 1) v
+WHERE b.description = 'Seed bid description';
+
+INSERT INTO feedbacks (id, bid_id, description, username, created_at)
+SELECT md5('seed_feedback' || g)::uuid, md5('seed_bid' || (1 + g % {bids}))::uuid, 'Seed feedback',
+       'seed_user_' || (1 + g % {employees}), now() - (g || ' seconds')::interval
+FROM generate_series(1, {feedbacks}) g;
+
+ANALYZE employee, organization, organization_responsible, tenders, tenders_archives, bids, bids_archives, feedbacks;
+"""
+
+
+async def seed(
+        connection: asyncpg.Connection,
+        employees: int = 1000,
+        organizations: int = 100,
+        tenders: int = 20000,
+        bids: int = 50000,
+        feedbacks: int = 20000,
+        versions: int = 5
+) -> None:
+    await connection.execute(SEED_SQL.format(
+        employees=employees,
+        organizations=organizations,
+        tenders=tenders,
+        bids=bids,
+        feedbacks=feedbacks,
+        versions=versions,
+    ))
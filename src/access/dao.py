@@ -0,0 +1,139 @@
+import uuid
+from typing import Dict, Iterable, List, Optional, Set
+
+from fastapi import HTTPException
+from sqlalchemy import select, and_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.access.schemas import TenderAccess, BidAccess
+from src.bids.models import Bid
+from src.models.models import Employee, OrganizationResponsible
+from src.tenders.models import Tender
+
+
+class AccessDAO:
+
+    @classmethod
+    async def resolve_tender(
+            cls,
+            session: AsyncSession,
+            username: str,
+            tender_id: uuid.UUID
+    ) -> Optional[TenderAccess]:
+        try:
+            query = (
+                select(Employee, Tender, OrganizationResponsible.id)
+                .select_from(Employee)
+                .outerjoin(Tender, Tender.id == tender_id)
+                .outerjoin(OrganizationResponsible, and_(
+                    OrganizationResponsible.organization_id == Tender.organization_id,
+                    OrganizationResponsible.user_id == Employee.id))
+                .where(Employee.username == username)
+                .limit(1)
+            )
+            row = (await session.execute(query)).first()
+            if row is None:
+                return None
+
+            user, tender, responsible_id = row
+            return TenderAccess(user=user, tender=tender, is_responsible=responsible_id is not None)
+
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    async def resolve_tenders(
+            cls,
+            session: AsyncSession,
+            username: str,
+            tender_ids: List[uuid.UUID]
+    ) -> Optional[List[TenderAccess]]:
+        try:
+            query = (
+                select(Employee, Tender, OrganizationResponsible.id)
+                .select_from(Employee)
+                .outerjoin(Tender, Tender.id.in_(tender_ids))
+                .outerjoin(OrganizationResponsible, and_(
+                    OrganizationResponsible.organization_id == Tender.organization_id,
+                    OrganizationResponsible.user_id == Employee.id))
+                .where(Employee.username == username)
+            )
+            rows = (await session.execute(query)).all()
+            if not rows:
+                return None
+
+            accesses = {}
+            for user, tender, responsible_id in rows:
+                if tender is None:
+                    continue
+                access = accesses.setdefault(tender.id, TenderAccess(user=user, tender=tender, is_responsible=False))
+                access.is_responsible = access.is_responsible or responsible_id is not None
+            return list(accesses.values())
+
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    async def resolve_memberships(
+            cls,
+            session: AsyncSession,
+            usernames: Iterable[str]
+    ) -> Dict[str, Set[uuid.UUID]]:
+        try:
+            query = (
+                select(Employee.username, OrganizationResponsible.organization_id)
+                .select_from(Employee)
+                .outerjoin(OrganizationResponsible, OrganizationResponsible.user_id == Employee.id)
+                .where(Employee.username.in_(list(set(usernames))))
+            )
+            memberships = {}
+            for username, organization_id in await session.execute(query):
+                organizations = memberships.setdefault(username, set())
+                if organization_id is not None:
+                    organizations.add(organization_id)
+            return memberships
+
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    async def resolve_bid(
+            cls,
+            session: AsyncSession,
+            username: str,
+            bid_id: uuid.UUID
+    ) -> Optional[BidAccess]:
+        try:
+            tender_responsible = aliased(OrganizationResponsible)
+            author_responsible = aliased(OrganizationResponsible)
+            query = (
+                select(Employee, Bid, Tender.organization_id, tender_responsible.id, author_responsible.id)
+                .select_from(Employee)
+                .outerjoin(Bid, Bid.id == bid_id)
+                .outerjoin(Tender, Tender.id == Bid.tender_id)
+                .outerjoin(tender_responsible, and_(
+                    tender_responsible.organization_id == Tender.organization_id,
+                    tender_responsible.user_id == Employee.id))
+                .outerjoin(author_responsible, and_(
+                    author_responsible.organization_id == Bid.author_id,
+                    author_responsible.user_id == Employee.id))
+                .where(Employee.username == username)
+                .limit(1)
+            )
+            row = (await session.execute(query)).first()
+            if row is None:
+                return None
+
+            user, bid, tender_organization_id, tender_responsible_id, author_responsible_id = row
+            return BidAccess(
+                user=user,
+                bid=bid,
+                tender_organization_id=tender_organization_id,
+                is_tender_responsible=tender_responsible_id is not None,
+                is_author_responsible=author_responsible_id is not None
+            )
+
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
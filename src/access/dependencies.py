@@ -0,0 +1,60 @@
+import uuid
+
+from fastapi import Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.access.dao import AccessDAO
+from src.access.schemas import TenderAccess, BidAccess
+from src.database import get_async_session
+from src.utils.custom_exceptions import (
+    UserNotFoundException,
+    TenderNotFoundException,
+    BidNotFoundException,
+    ServerErrorException
+)
+
+
+# Зависимости только проверяют доступ в собственной короткой транзакции; изменения роут выполняет в своей
+# session.begin(), а UPDATE сверяет прочитанную здесь версию записи
+async def get_tender_access(
+        tender_id: uuid.UUID,
+        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        session: AsyncSession = Depends(get_async_session)
+) -> TenderAccess:
+    async with session.begin():
+        try:
+            access = await AccessDAO.resolve_tender(session, username=username, tender_id=tender_id)
+            if not access:
+                raise UserNotFoundException()
+            if not access.tender:
+                raise TenderNotFoundException()
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+    return access
+
+
+async def get_bid_access(
+        bid_id: uuid.UUID,
+        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        session: AsyncSession = Depends(get_async_session)
+) -> BidAccess:
+    async with session.begin():
+        try:
+            access = await AccessDAO.resolve_bid(session, username=username, bid_id=bid_id)
+            if not access:
+                raise UserNotFoundException()
+            if not access.bid:
+                raise BidNotFoundException()
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+    return access
@@ -0,0 +1,31 @@
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from src.bids.models import Bid
+from src.models.models import Employee
+from src.tenders.models import Tender
+
+
+@dataclass
+class TenderAccess:
+    user: Employee
+    tender: Optional[Tender]
+    is_responsible: bool
+
+
+@dataclass
+class BidAccess:
+    user: Employee
+    bid: Optional[Bid]
+    tender_organization_id: Optional[uuid.UUID]
+    is_tender_responsible: bool
+    is_author_responsible: bool
+
+    @property
+    def is_author(self) -> bool:
+        return self.bid.author_id == self.user.id
+
+    @property
+    def can_edit(self) -> bool:
+        return self.is_author or self.is_author_responsible
@@ -1,13 +1,93 @@
-from src.bids.models import Bid, BidArchive, FeedBack
+import uuid
+from typing import Dict, Iterable, Set
+
+from fastapi import HTTPException
+from sqlalchemy import select, literal, union_all, bindparam, Integer
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.bids.models import Bid, BidArchive, FeedBack, TenderBidStats
 from src.dao.base import BaseDAO, ArchiveDAO
+from src.models.models import Organization, Employee
+from src.tenders.models import Tender
+from src.utils.custom_exceptions import BidNotFoundException
 
 
 class BidDAO(BaseDAO, ArchiveDAO):
     model = Bid
     model_archive = BidArchive
+    not_found_exception = BidNotFoundException
+    version_columns = ("version", "name", "status", "decision_status", "updated_at")
+    diff_columns = ("name", "description", "status", "tender_id", "author_type", "author_id", "decision_status")
+
+    @classmethod
+    async def find_existing_references(
+            cls,
+            session: AsyncSession,
+            organization_ids: Iterable[uuid.UUID],
+            tender_ids: Iterable[uuid.UUID],
+            employee_ids: Iterable[uuid.UUID]
+    ) -> Dict[str, Set[uuid.UUID]]:
+        references = {"organization": set(), "tender": set(), "employee": set()}
+        queries = [
+            select(literal(kind).label("kind"), model.id).where(model.id.in_(list(ids)))
+            for kind, model, ids in (
+                ("organization", Organization, set(organization_ids)),
+                ("tender", Tender, set(tender_ids)),
+                ("employee", Employee, set(employee_ids)),
+            )
+            if ids
+        ]
+        if not queries:
+            return references
+
+        try:
+            result = await session.execute(union_all(*queries))
+            for kind, ref_id in result:
+                references[kind].add(ref_id)
+            return references
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
 
 class BidArchiveDAO(BaseDAO):
     model = BidArchive
 
+class BidStatsDAO(BaseDAO):
+    model = TenderBidStats
+
 class FeedbackDAO(BaseDAO):
-    model = FeedBack
\ No newline at end of file
+    model = FeedBack
+
+    @classmethod
+    def _bid_author_query(cls):
+        cache_key = (cls.model, "bid_author")
+        query = cls._query_cache.get(cache_key)
+        if query is not None:
+            return query
+
+        query = (
+            select(cls.model)
+            .join(Bid, Bid.id == cls.model.bid_id)
+            .where(Bid.author_id == bindparam("author_id"))
+            .order_by(cls.model.created_at, cls.model.id)
+            .limit(bindparam("limit", type_=Integer))
+            .offset(bindparam("offset", type_=Integer))
+        )
+        cls._query_cache[cache_key] = query
+        return query
+
+    @classmethod
+    async def find_by_bid_author(
+            cls,
+            session: AsyncSession,
+            author_id: uuid.UUID,
+            limit: int = 5,
+            offset: int = 0
+    ):
+        try:
+            result = await session.execute(
+                cls._bid_author_query(), {"author_id": author_id, "limit": limit, "offset": offset}
+            )
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
@@ -1,11 +1,11 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, String, UUID, Enum, ForeignKey, Integer, func, Text
-from sqlalchemy.dialects.postgresql import TIMESTAMP
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, UUID, Enum, ForeignKey, Integer, func, Text, Index, Computed
+from sqlalchemy.dialects.postgresql import TIMESTAMP, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 
-from src.database import Base
+from src.database import Base, SEARCH_VECTOR_SQL
 
 
 class BidStatus(str, enum.Enum):
@@ -39,14 +39,23 @@ class Bid(Base):
     decision_status = Column(Enum(DecisionStatus), default=DecisionStatus.Pending, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=False))
 
     tenders = relationship("Tender", back_populates="bids")
     feedbacks = relationship("FeedBack", back_populates="bids")
 
+    __table_args__ = (
+        Index("ix_bids_tender_id", "tender_id"),
+        Index("ix_bids_author_id_name", "author_id", "name", "id"),
+        Index("ix_bids_status_name", "status", "name", "id"),
+        Index("ix_bids_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 class BidArchive(Base):
     __tablename__ = "bids_archives"
 
-    archive_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True, unique=True)
+    archive_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    archived_at = Column(TIMESTAMP, primary_key=True, server_default=func.now(), nullable=False)
     id = Column(UUID(as_uuid=True), index=True)
     name = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
@@ -61,6 +70,11 @@ class BidArchive(Base):
 
     tenders = relationship("Tender", back_populates="bids_archives")
 
+    __table_args__ = (
+        Index("ix_bids_archives_id_version", "id", "version"),
+        {"postgresql_partition_by": "RANGE (archived_at)"},
+    )
+
 
 class FeedBack(Base):
     __tablename__ = "feedbacks"
@@ -72,4 +86,22 @@ class FeedBack(Base):
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
 
     user = relationship("Employee", back_populates="feedbacks")
-    bids = relationship("Bid", back_populates="feedbacks")
\ No newline at end of file
+    bids = relationship("Bid", back_populates="feedbacks")
+
+    __table_args__ = (
+        Index("ix_feedbacks_bid_id_created_at", "bid_id", "created_at"),
+    )
+
+
+class TenderBidStats(Base):
+    __tablename__ = "tender_bid_stats"
+
+    tender_id = Column(UUID(as_uuid=True), ForeignKey("tenders.id", ondelete="CASCADE"), primary_key=True)
+    bids_total = Column(Integer, default=0, server_default="0", nullable=False)
+    created = Column(Integer, default=0, server_default="0", nullable=False)
+    published = Column(Integer, default=0, server_default="0", nullable=False)
+    canceled = Column(Integer, default=0, server_default="0", nullable=False)
+    pending = Column(Integer, default=0, server_default="0", nullable=False)
+    approved = Column(Integer, default=0, server_default="0", nullable=False)
+    rejected = Column(Integer, default=0, server_default="0", nullable=False)
+    last_activity_at = Column(TIMESTAMP, nullable=True)
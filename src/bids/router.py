@@ -1,13 +1,18 @@
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.access.dao import AccessDAO
+from src.access.dependencies import get_bid_access
+from src.access.schemas import BidAccess
 from src.bids.dao import BidDAO, BidArchiveDAO, FeedbackDAO
 from src.bids.schemas import BidResponse, BidCreate, AuthorType, BidStatus, UpdateBidRequest, DecisionStatus, \
-    FeedBackResponse
-from src.database import get_async_session
+    FeedBackResponse, BidBulkCreate, BidBulkResult, BidVersionSummary
+from src.dao.base import SEARCH_RANK
+from src.database import get_async_session, get_read_session
 from src.models.dao import OrganizationDAO, EmployeeDAO, OrganizationResponsibleDAO
 from src.tenders.dao import TenderDAO
 from src.utils.custom_exceptions import (
@@ -24,8 +29,16 @@ from src.utils.error_schemas import (
     custom_401_response,
     custom_403_response,
     custom_404_response_tender,
-    custom_400_response, custom_404_response_org, custom_404_response_bid
+    custom_400_response, custom_404_response_org, custom_404_response_bid,
+    custom_304_response,
+    custom_412_response,
+    next_cursor_header,
+    etag_header
 )
+from src.utils.etag import make_etag, etag_matches, not_modified, expected_version
+from src.utils.export import ExportFormat, export_response, export_responses
+from src.utils.serialization import json_response
+from src.utils.versions import VersionDiff, diff_versions
 
 
 
@@ -83,7 +96,77 @@ async def create_bid(
                 author_id=new_bid.author_id
             )
 
-            return result
+            return json_response(BidResponse, result)
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.post("/bulk",
+             summary="Пакетное создание предложений",
+             description="Создание нескольких предложений одним запросом. "
+                         "Ссылки на организации, тендеры и авторов проверяются для всех предложений сразу, "
+                         "корректные предложения вставляются одной операцией. "
+                         "Для каждого предложения возвращается отдельный результат.",
+             response_model=List[BidBulkResult],
+             responses={
+                 200: {
+                     "description": "Результаты создания предложений в порядке запроса.",
+                 },
+                 422: custom_422_response,
+                 500: custom_500_response
+             }
+             )
+async def create_bids_bulk(
+        new_bids: BidBulkCreate,
+        session: AsyncSession = Depends(get_async_session),
+):
+    async with session.begin():
+        try:
+            references = await BidDAO.find_existing_references(
+                session,
+                organization_ids=[bid.author_id for bid in new_bids.bids if bid.author_type == AuthorType.Organization],
+                tender_ids=[bid.tender_id for bid in new_bids.bids],
+                employee_ids=[bid.author_id for bid in new_bids.bids if bid.author_type == AuthorType.User]
+            )
+
+            results = {}
+            valid = []
+            for index, new_bid in enumerate(new_bids.bids):
+                error = None
+                if new_bid.author_type == AuthorType.Organization and new_bid.author_id not in references["organization"]:
+                    error = OrganizationNotFoundException()
+                elif new_bid.author_type == AuthorType.User and new_bid.author_id not in references["employee"]:
+                    error = UserNotFoundException()
+                elif new_bid.tender_id not in references["tender"]:
+                    error = TenderNotFoundException()
+
+                if error:
+                    results[index] = BidBulkResult(index=index, status_code=error.status_code, error=error.detail)
+                else:
+                    valid.append(index)
+
+            created = await BidDAO.add_many_in_db(
+                session,
+                [
+                    {
+                        "name": new_bids.bids[index].name,
+                        "description": new_bids.bids[index].description,
+                        "status": "Created",
+                        "tender_id": new_bids.bids[index].tender_id,
+                        "author_type": new_bids.bids[index].author_type,
+                        "author_id": new_bids.bids[index].author_id,
+                    }
+                    for index in valid
+                ]
+            )
+            for index, bid in zip(valid, created):
+                results[index] = BidBulkResult(index=index, status_code=200, bid=BidResponse.model_validate(bid))
+
+            return [results[index] for index in range(len(new_bids.bids))]
 
         except HTTPException as e:
             raise e
@@ -99,13 +182,16 @@ async def create_bid(
             responses={
                 200: {
                     "description": "Список предложений пользователя, отсортированный по алфавиту.",
+                    "headers": {**next_cursor_header, **etag_header},
                 },
+                304: custom_304_response,
                 401: custom_401_response,
                 422: custom_422_response,
                 500: custom_500_response
             }
             )
 async def get_my_bids(
+        response: Response,
         limit: int = Query(
             5,
             ge=1,
@@ -123,39 +209,105 @@ async def get_my_bids(
             AuthorType.User,
             description="От чьего имени создавалось предложение"
         ),
-        session: AsyncSession = Depends(get_async_session)
+        cursor: Optional[str] = Query(
+            None,
+            description="Курсор из заголовка X-Next-Cursor предыдущей страницы. Если задан, offset игнорируется."),
+        q: Optional[str] = Query(
+            None,
+            min_length=1,
+            max_length=200,
+            description="Поисковый запрос по названию и описанию предложения. Если задан, результаты сортируются по релевантности."),
+        if_none_match: Optional[str] = Header(None),
+        session: AsyncSession = Depends(get_read_session)
 ):
     async with session.begin():
         try:
             if author_type is None:
                 author_type = AuthorType.User
-            user = await EmployeeDAO.find_one(session, username=username)
+            user = await EmployeeDAO.find_by_username(session, username)
             if not user:
                 raise UserNotFoundException()
 
+            filters = dict(
+                limit=limit,
+                offset=offset,
+                order_by_column="name",
+                ascending=True,
+                cursor=cursor,
+                search=q
+            )
+
             if author_type == AuthorType.User:
-                bids = await BidDAO.find_with_filters(
-                    session,
-                    limit=limit,
-                    offset=offset,
-                    order_by_column="name",
-                    ascending=True,
-                    author_id=user.id
-                )
+                filters["author_id"] = user.id
 
             if author_type == AuthorType.Organization:
-                org_resp = await OrganizationResponsibleDAO.find_all(session, user_id=user.id)
+                org_resp = await OrganizationResponsibleDAO.find_by_user(session, user.id)
                 org_ids = [org.organization_id for org in org_resp]
                 if not org_ids:
                     return []
-                bids = await BidDAO.find_with_filters(
-                    session,
-                    limit=limit,
-                    offset=offset,
-                    author_id=org_ids,
-                )
+                filters["author_id"] = org_ids
+
+            if if_none_match:
+                etag = make_etag(*await BidDAO.fingerprint_with_filters(session, **filters))
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            bids = await BidDAO.find_mappings_with_filters(session, **filters)
+            response.headers["ETag"] = make_etag(*BidDAO.fingerprint(bids))
+
+            next_cursor = BidDAO.next_cursor(bids, limit, SEARCH_RANK if q else "name")
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+
+            return json_response(List[BidResponse], bids, response)
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.get("/export",
+            summary="Выгрузка предложений организации",
+            description="Потоковая выгрузка всех предложений, созданных от имени организации, в NDJSON или CSV. "
+                        "Строки читаются серверным курсором пачками, без пагинации и повторных запросов.",
+            response_class=StreamingResponse,
+            responses={
+                200: export_responses,
+                401: custom_401_response,
+                403: custom_403_response,
+                404: custom_404_response_org,
+                422: custom_422_response,
+                500: custom_500_response
+            }
+            )
+async def export_bids(
+        organization_id: uuid.UUID = Query(
+            ...,
+            description="Организация, предложения которой выгружаются."),
+        username: str = Query(
+            ...,
+            max_length=50,
+            description="Имя пользователя, ответственного за организацию"),
+        format: ExportFormat = Query(
+            ExportFormat.ndjson,
+            description="Формат выгрузки: ndjson или csv."),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            user = await EmployeeDAO.find_by_username(session, username)
+            if not user:
+                raise UserNotFoundException()
+
+            org = await OrganizationDAO.find_one(session, id=organization_id)
+            if not org:
+                raise OrganizationNotFoundException()
 
-            return bids
+            org_resp = await OrganizationResponsibleDAO.find_by_user(session, user.id)
+            if not any(resp.organization_id == organization_id for resp in org_resp):
+                raise ForbiddenActionException()
 
         except HTTPException as e:
             raise e
@@ -163,6 +315,8 @@ async def get_my_bids(
         except Exception as _:
             raise ServerErrorException()
 
+    return export_response(BidDAO, BidResponse, format, f"bids_{organization_id}", author_id=organization_id)
+
 
 @router.get("/{tender_id}/list",
             summary="Получение списка предложений для тендера",
@@ -171,7 +325,9 @@ async def get_my_bids(
             responses={
                 200: {
                     "description": "Список предложений, отсортированный по алфавиту.",
+                    "headers": etag_header,
                 },
+                304: custom_304_response,
                 401: custom_401_response,
                 403: custom_403_response,
                 404: custom_404_response_tender,
@@ -181,6 +337,7 @@ async def get_my_bids(
             )
 async def get_list_bids(
         tender_id: uuid.UUID,
+        response: Response,
         username: str = Query(
             ...,
             max_length=50,
@@ -194,42 +351,52 @@ async def get_list_bids(
             0,
             ge=0,
             description="Количество объектов, пропущенных с начала."),
-        session: AsyncSession = Depends(get_async_session),
+        q: Optional[str] = Query(
+            None,
+            min_length=1,
+            max_length=200,
+            description="Поисковый запрос по названию и описанию предложения. Если задан, результаты сортируются по релевантности."),
+        if_none_match: Optional[str] = Header(None),
+        session: AsyncSession = Depends(get_read_session),
 
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
+            access = await AccessDAO.resolve_tender(session, username=username, tender_id=tender_id)
+            if not access:
                 raise UserNotFoundException()
 
-            tender = await TenderDAO.find_one(session, id=tender_id)
-            if not tender:
+            if not access.tender:
                 raise TenderNotFoundException()
 
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            if not access.is_responsible:
                 raise ForbiddenActionException()
 
-            return await BidDAO.find_with_filters(
-                session,
+            filters = dict(
                 limit=limit,
                 offset=offset,
                 order_by_column="name",
                 ascending=True,
+                search=q,
                 status=BidStatus.Published
             )
 
+            if if_none_match:
+                etag = make_etag(*await BidDAO.fingerprint_with_filters(session, **filters))
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            bids = await BidDAO.find_mappings_with_filters(session, **filters)
+            response.headers["ETag"] = make_etag(*BidDAO.fingerprint(bids))
+
+            return json_response(List[BidResponse], bids, response)
+
         except HTTPException as e:
             raise e
 
         except Exception as _:
             raise ServerErrorException()
 
-
 @router.get("/{bid_id}/status",
             summary="Получение статуса предложения",
             description="Получить статус предложения по его уникальному идентификатору.",
@@ -237,7 +404,9 @@ async def get_list_bids(
             responses={
                 200: {
                     "description": "Текущий статус предложения.",
+                    "headers": etag_header,
                 },
+                304: custom_304_response,
                 401: custom_401_response,
                 403: custom_403_response,
                 404: custom_404_response_bid,
@@ -247,24 +416,30 @@ async def get_list_bids(
             )
 async def get_status_bids(
         bid_id: uuid.UUID,
+        response: Response,
         username: str = Query(
             ...,
             max_length=50,
             description="Имя пользователя, для которого нужно получить статус предложения"),
+        if_none_match: Optional[str] = Header(None),
         session: AsyncSession = Depends(get_async_session),
 
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
+            access = await AccessDAO.resolve_bid(session, username=username, bid_id=bid_id)
+            if not access:
                 raise UserNotFoundException()
 
-            bid = await BidDAO.find_one(session, id=bid_id)
-            if not bid:
+            if not access.bid:
                 raise BidNotFoundException()
 
-            return bid.status
+            etag = make_etag(access.bid.id, access.bid.version)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+            response.headers["ETag"] = etag
+            return access.bid.status
 
         except HTTPException as e:
             raise e
@@ -280,11 +455,13 @@ async def get_status_bids(
     responses={
         200: {
             "description": "Статус предложения успешно изменен.",
+            "headers": etag_header,
         },
         400: custom_400_response,
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_bid,
+        412: custom_412_response,
         422: custom_422_response,
         500: custom_500_response
     }
@@ -292,46 +469,29 @@ async def get_status_bids(
 async def edit_bid_status(
         bid_id: uuid.UUID,
         new_status: BidStatus,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        access: BidAccess = Depends(get_bid_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            bid = await BidDAO.find_one(session, id=bid_id)
-            if not bid:
-                raise BidNotFoundException()
-
-            if bid.author_id == user.id:
-                if bid.status == new_status:
-                    raise HTTPException(status_code=400, detail="Новый статус не может быть таким же, как и текущий")
-
-                await BidDAO.archive(session, bid)
-
-                update_data = {"status": new_status}
-                result = await BidDAO.update_in_db(session, bid, **update_data)
-
-                return BidResponse.from_orm(result)
-
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=bid.author_id,
-                user_id=user.id)
-            if not user_verification:
+            bid = access.bid
+            if not access.can_edit:
                 raise ForbiddenActionException()
 
+            expected = expected_version(if_match, bid)
+
             if bid.status == new_status:
                 raise HTTPException(status_code=400, detail="Новый статус не может быть таким же, как и текущий")
 
             await BidDAO.archive(session, bid)
 
             update_data = {"status": new_status}
-            result = await BidDAO.update_in_db(session, bid, **update_data)
+            result = await BidDAO.update_in_db(session, bid, expected_version=expected, **update_data)
 
-            return BidResponse.from_orm(result)
+            response.headers["ETag"] = make_etag(result.id, result.version)
+            return json_response(BidResponse, result, response)
 
         except HTTPException as e:
             raise e
@@ -348,10 +508,12 @@ async def edit_bid_status(
     responses={
         200: {
             "description": "Предложение успешно изменено и возвращает обновленную информацию.",
+            "headers": etag_header,
         },
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_bid,
+        412: custom_412_response,
         422: custom_422_response,
         500: custom_500_response
     }
@@ -359,43 +521,19 @@ async def edit_bid_status(
 async def edit_bid(
         bid_id: uuid.UUID,
         update_data: UpdateBidRequest,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        access: BidAccess = Depends(get_bid_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            bid = await BidDAO.find_one(session, id=bid_id)
-            if not bid:
-                raise BidNotFoundException()
-
-            if bid.author_id == user.id:
-
-                await BidDAO.archive(session, bid)
-
-                if update_data.name is None:
-                    update_data.name = bid.name
-                if update_data.description is None:
-                    update_data.description = bid.description
-                if update_data.status is None:
-                    update_data.status = bid.status
-
-                update_data_dict = update_data.dict(exclude_unset=True)
-
-                result = await BidDAO.update_in_db(session, bid, **update_data_dict)
-
-                return BidResponse.from_orm(result)
-
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=bid.author_id,
-                user_id=user.id)
-            if not user_verification:
+            bid = access.bid
+            if not access.can_edit:
                 raise ForbiddenActionException()
 
+            expected = expected_version(if_match, bid)
+
             await BidDAO.archive(session, bid)
 
             if update_data.name is None:
@@ -407,9 +545,10 @@ async def edit_bid(
 
             update_data_dict = update_data.dict(exclude_unset=True)
 
-            result = await BidDAO.update_in_db(session, bid, **update_data_dict)
+            result = await BidDAO.update_in_db(session, bid, expected_version=expected, **update_data_dict)
 
-            return BidResponse.from_orm(result)
+            response.headers["ETag"] = make_etag(result.id, result.version)
+            return json_response(BidResponse, result, response)
 
         except HTTPException as e:
             raise e
@@ -427,11 +566,13 @@ async def edit_bid(
     responses={
         200: {
             "description": "Предложение успешно откатано и версия инкрементирована.",
+            "headers": etag_header,
         },
         400: custom_400_response,
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_bid,
+        412: custom_412_response,
         422: custom_422_response,
         500: custom_500_response
     }
@@ -439,49 +580,19 @@ async def edit_bid(
 async def rollback_tender(
         bid_id: uuid.UUID,
         version: int,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        access: BidAccess = Depends(get_bid_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            bid = await BidDAO.find_one(session, id=bid_id)
-            if not bid:
-                raise BidNotFoundException()
-
-            if bid.author_id == user.id:
-
-                archive_bid = await BidArchiveDAO.find_one(session, id=bid_id, version=version)
-                if not archive_bid:
-                    raise HTTPException(status_code=404, detail="Указанная версия предложения не найдена в архиве")
-
-                update_data_dict = {
-                    "name": archive_bid.name,
-                    "description": archive_bid.description,
-                    "status": archive_bid.status,
-                    "tender_id": archive_bid.tender_id,
-                    "author_type": archive_bid.author_type,
-                    "author_id": archive_bid.author_id,
-                    "version": bid.version,
-                    "created_at": archive_bid.created_at
-                }
-
-                await BidDAO.archive(session, bid)
-
-                result = await BidDAO.update_in_db(session, bid, **update_data_dict)
-
-                return BidResponse.from_orm(result)
-
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=bid.author_id,
-                user_id=user.id)
-            if not user_verification:
+            bid = access.bid
+            if not access.can_edit:
                 raise ForbiddenActionException()
 
+            expected = expected_version(if_match, bid)
+
             archive_bid = await BidArchiveDAO.find_one(session, id=bid_id, version=version)
             if not archive_bid:
                 raise HTTPException(status_code=404, detail="Указанная версия предложения не найдена в архиве")
@@ -493,15 +604,15 @@ async def rollback_tender(
                 "tender_id": archive_bid.tender_id,
                 "author_type": archive_bid.author_type,
                 "author_id": archive_bid.author_id,
-                "version": bid.version,
                 "created_at": archive_bid.created_at
             }
 
             await BidDAO.archive(session, bid)
 
-            result = await BidDAO.update_in_db(session, bid, **update_data_dict)
+            result = await BidDAO.update_in_db(session, bid, expected_version=expected, **update_data_dict)
 
-            return BidResponse.from_orm(result)
+            response.headers["ETag"] = make_etag(result.id, result.version)
+            return json_response(BidResponse, result, response)
 
         except HTTPException as e:
             raise e
@@ -530,35 +641,23 @@ async def rollback_tender(
 async def edit_bid_status(
         bid_id: uuid.UUID,
         decision: DecisionStatus,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        access: BidAccess = Depends(get_bid_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            bid = await BidDAO.find_one(session, id=bid_id)
-            if not bid:
-                raise BidNotFoundException()
-
-            tender = await TenderDAO.find_one(session, id=bid.tender_id)
-            if not tender:
+            bid = access.bid
+            if not access.tender_organization_id:
                 raise TenderNotFoundException()
 
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            if not access.is_tender_responsible:
                 raise ForbiddenActionException()
 
             update_data = {"decision_status": decision}
 
             result = await BidDAO.update_in_db(session, bid, **update_data)
 
-            return BidResponse.from_orm(result)
+            return json_response(BidResponse, result)
 
         except HTTPException as e:
             raise e
@@ -586,38 +685,25 @@ async def edit_bid_status(
 async def send_feedback(
         bid_id: uuid.UUID,
         bid_feedback: str = Query("Хочу на стажировку в Avito!", max_length=1000, description="Фидбэк"),
-        username: str = Query("test_user", max_length=50, description="Ваше имя пользователя"),
+        access: BidAccess = Depends(get_bid_access),
         session: AsyncSession = Depends(get_async_session),
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            bid = await BidDAO.find_one(session, id=bid_id)
-            if not bid:
-                raise BidNotFoundException()
-
-            tender = await TenderDAO.find_one(session, id=bid.tender_id)
-            if not tender:
+            if not access.tender_organization_id:
                 raise TenderNotFoundException()
 
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            if not access.is_tender_responsible:
                 raise ForbiddenActionException()
 
             result = await FeedbackDAO.add_in_db(
                 session,
                 bid_id=bid_id,
                 description=bid_feedback,
-                username=username
+                username=access.user.username
             )
 
-            return FeedBackResponse.from_orm(result)
+            return json_response(FeedBackResponse, result)
 
         except HTTPException as e:
             raise e
@@ -626,7 +712,6 @@ async def send_feedback(
             print(_)
             raise ServerErrorException()
 
-
 @router.get("/{tender_id}/reviews",
             summary="Отправка отзыва по предложению",
             description="Отправить отзыв по предложение.",
@@ -653,7 +738,7 @@ async def get_reviews(
             "test_user",
             max_length=50,
             description="Имя пользователя, который запрашивает отзывы."),
-        session: AsyncSession = Depends(get_async_session),
+        session: AsyncSession = Depends(get_read_session),
         limit: int = Query(
             5,
             ge=1,
@@ -666,42 +751,27 @@ async def get_reviews(
 ):
     async with session.begin():
         try:
-            user_request = await EmployeeDAO.find_one(session, username=request_username)
-            if not user_request:
+            access = await AccessDAO.resolve_tender(session, username=request_username, tender_id=tender_id)
+            if not access:
                 raise UserNotFoundException()
 
-            tender = await TenderDAO.find_one(session, id=tender_id)
-            if not tender:
+            if not access.tender:
                 raise TenderNotFoundException()
 
-            user_req_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user_request.id)
-            if not user_req_verification:
+            if not access.is_responsible:
                 raise ForbiddenActionException()
 
-            user_author = await EmployeeDAO.find_one(session, username=author_username_or_organization_name)
-            if not user_author:
-                organization_author = await OrganizationDAO.find_one(session, name=author_username_or_organization_name)
-                if not organization_author:
+            author = await EmployeeDAO.find_by_username(session, author_username_or_organization_name)
+            if not author:
+                author = await OrganizationDAO.find_one(session, name=author_username_or_organization_name)
+                if not author:
                     raise HTTPException(status_code=404, detail="Автор не существует или некорректен")
 
-            if user_author:
-                author = user_author
-            elif organization_author:
-                author = organization_author
-            else:
-                raise HTTPException(status_code=404, detail="Автор не существует или некорректен")
-
-            bids = await BidDAO.find_all(session, author_id=author.id)
-            reviews = await FeedbackDAO.find_with_filters(
+            reviews = await FeedbackDAO.find_by_bid_author(
                 session,
+                author_id=author.id,
                 limit=limit,
-                offset=offset,
-                order_by_column="created_at",
-                ascending=True,
-                bid_id=[bid.id for bid in bids]
+                offset=offset
             )
 
             return reviews
@@ -713,3 +783,102 @@ async def get_reviews(
         except Exception as _:
             print(_)
             raise ServerErrorException()
+
+
+@router.get(
+    "/{bid_id}/versions",
+    summary="История версий предложения",
+    description="Список версий предложения, начиная с текущей, в порядке убывания номера версии.",
+    response_model=List[BidVersionSummary],
+    responses={
+        200: {
+            "description": "Краткие сведения о версиях предложения.",
+            "headers": next_cursor_header,
+        },
+        400: custom_400_response,
+        401: custom_401_response,
+        403: custom_403_response,
+        404: custom_404_response_bid,
+        422: custom_422_response,
+        500: custom_500_response
+    }
+)
+async def get_bid_versions(
+        response: Response,
+        bid_id: uuid.UUID,
+        limit: int = Query(
+            5,
+            ge=1,
+            le=100,
+            description="Максимальное число возвращаемых объектов."),
+        offset: int = Query(
+            0,
+            ge=0,
+            description="Количество объектов, пропущенных с начала."),
+        cursor: Optional[str] = Query(
+            None,
+            description="Курсор из заголовка X-Next-Cursor предыдущей страницы. Если задан, offset игнорируется."),
+        access: BidAccess = Depends(get_bid_access),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            if not (access.can_edit or access.is_tender_responsible):
+                raise ForbiddenActionException()
+
+            versions = await BidDAO.find_versions(session, bid_id, limit=limit, offset=offset, cursor=cursor)
+
+            next_cursor = BidDAO.next_versions_cursor(versions, limit, bid_id)
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+
+            return versions
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.get(
+    "/{bid_id}/versions/diff",
+    summary="Сравнение версий предложения",
+    description="Список полей предложения, отличающихся между двумя версиями.",
+    response_model=VersionDiff,
+    responses={
+        200: {
+            "description": "Изменения между версиями.",
+        },
+        401: custom_401_response,
+        403: custom_403_response,
+        404: custom_404_response_bid,
+        422: custom_422_response,
+        500: custom_500_response
+    }
+)
+async def get_bid_versions_diff(
+        bid_id: uuid.UUID,
+        version_from: int = Query(..., ge=1, description="Исходная версия."),
+        version_to: Optional[int] = Query(None, ge=1, description="Конечная версия, по умолчанию текущая."),
+        access: BidAccess = Depends(get_bid_access),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            bid = access.bid
+            if not (access.can_edit or access.is_tender_responsible):
+                raise ForbiddenActionException()
+
+            old = await BidDAO.find_version(session, bid, version_from)
+            new = await BidDAO.find_version(session, bid, version_to or bid.version)
+            if not old or not new:
+                raise HTTPException(status_code=404, detail="Указанная версия предложения не найдена в архиве")
+
+            return diff_versions(old, new, BidDAO.diff_columns)
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
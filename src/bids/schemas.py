@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -52,6 +52,22 @@ class BidResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class BidBulkCreate(BaseModel):
+    bids: List[BidCreate] = Field(..., min_length=1, max_length=1000)
+
+class BidBulkResult(BaseModel):
+    index: int = Field(..., example=0, description="Позиция предложения в запросе")
+    status_code: int = Field(..., example=200)
+    bid: Optional[BidResponse] = None
+    error: Optional[str] = Field(None, example="Тендер не существует")
+
+class BidVersionSummary(BaseModel):
+    version: int = Field(..., example=2)
+    name: str = Field(..., example="Доставка товаров")
+    status: BidStatus = Field(..., example="Published")
+    decision_status: DecisionStatus = Field(..., example="Pending")
+    updated_at: datetime = Field(..., example="2006-01-02T15:04:05Z07:00")
+
 class UpdateBidRequest(BaseModel):
     name: Optional[str] = Field(None, max_length=100, description="Название тендера")
     description: Optional[str] = Field(None, max_length=500, description="Описание тендера")
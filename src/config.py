@@ -11,4 +11,52 @@ POSTGRES_HOST = os.environ.get("POSTGRES_HOST")
 POSTGRES_PORT = os.environ.get("POSTGRES_PORT")
 POSTGRES_DATABASE = os.environ.get("POSTGRES_DATABASE")
 POSTGRES_JDBC_URL = f"jdbc:postgresql://{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}"
-POSTGRES_CONN=f"postgresql+asyncpg://{POSTGRES_USERNAME}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}"
\ No newline at end of file
+POSTGRES_CONN=f"postgresql+asyncpg://{POSTGRES_USERNAME}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}"
+POSTGRES_DSN = f"postgresql://{POSTGRES_USERNAME}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}"
+
+# Реплика для чтения необязательна: без POSTGRES_REPLICA_HOST все запросы идут в основную базу
+POSTGRES_REPLICA_HOST = os.environ.get("POSTGRES_REPLICA_HOST")
+POSTGRES_REPLICA_PORT = os.environ.get("POSTGRES_REPLICA_PORT") or POSTGRES_PORT
+POSTGRES_REPLICA_CONN = (
+    f"postgresql+asyncpg://{POSTGRES_USERNAME}:{POSTGRES_PASSWORD}@{POSTGRES_REPLICA_HOST}:{POSTGRES_REPLICA_PORT}/{POSTGRES_DATABASE}"
+    if POSTGRES_REPLICA_HOST else None
+)
+# Столько секунд после успешной записи чтения клиента идут в основную базу, чтобы не увидеть отставание реплики
+READ_YOUR_WRITES_WINDOW = float(os.environ.get("READ_YOUR_WRITES_WINDOW", 5))
+
+CACHE_MAXSIZE = int(os.environ.get("CACHE_MAXSIZE", 10000))
+CACHE_TTL = float(os.environ.get("CACHE_TTL", 60))
+
+# Кэш ответов GET /tenders: memory - в памяти воркера, shm - общий для воркеров каталог в tmpfs, none - отключен
+RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_MAXSIZE = int(os.environ.get("RESPONSE_CACHE_MAXSIZE", 1000))
+RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", 30))
+RESPONSE_CACHE_DIR = os.environ.get("RESPONSE_CACHE_DIR", "/dev/shm/tender-response-cache")
+
+UVICORN_WORKERS = int(os.environ.get("UVICORN_WORKERS", 4))
+DB_MAX_CONNECTIONS = int(os.environ.get("DB_MAX_CONNECTIONS", 80))
+DB_POOL_MAX_OVERFLOW = int(os.environ.get("DB_POOL_MAX_OVERFLOW", 5))
+# На каждый воркер: пул + overflow + соединение LISTEN для инвалидации кэша
+DB_POOL_SIZE = int(os.environ.get(
+    "DB_POOL_SIZE",
+    max(1, DB_MAX_CONNECTIONS // UVICORN_WORKERS - DB_POOL_MAX_OVERFLOW - 1)
+))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 10))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+
+DB_QUERY_DEBUG = os.environ.get("DB_QUERY_DEBUG", "false").lower() in ("1", "true", "yes")
+DB_QUERY_BUDGET = int(os.environ.get("DB_QUERY_BUDGET", 10))
+DB_QUERY_REPEAT_THRESHOLD = int(os.environ.get("DB_QUERY_REPEAT_THRESHOLD", 3))
+
+# Архивная версия удаляется, только если она вне последних ARCHIVE_KEEP_VERSIONS версий записи
+# и старше ARCHIVE_KEEP_DAYS дней; 0 отключает соответствующее условие, оба 0 - хранить все
+ARCHIVE_KEEP_VERSIONS = int(os.environ.get("ARCHIVE_KEEP_VERSIONS", 0))
+ARCHIVE_KEEP_DAYS = int(os.environ.get("ARCHIVE_KEEP_DAYS", 0))
+ARCHIVE_COMPACTION_INTERVAL = float(os.environ.get("ARCHIVE_COMPACTION_INTERVAL", 3600))
+ARCHIVE_COMPACTION_BATCH = int(os.environ.get("ARCHIVE_COMPACTION_BATCH", 5000))
+ARCHIVE_PARTITIONS_AHEAD = int(os.environ.get("ARCHIVE_PARTITIONS_AHEAD", 2))
+
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", 1000))
+IMPORT_BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", 5000))
@@ -1,12 +1,136 @@
+import hashlib
+from typing import Any, AsyncIterator, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
 from fastapi import HTTPException
-from sqlalchemy import select, Column, asc, desc, insert, inspect
+from sqlalchemy import select, update, func, Column, Integer, String, asc, desc, insert, tuple_, bindparam, union_all, cast, literal, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by, REAL
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import async_session_maker
+from src.database import SEARCH_CONFIG
+from src.utils.custom_exceptions import PreconditionFailedException, RecordNotFoundException
+from src.utils.pagination import encode_cursor, decode_cursor
+
+
+SEARCH_RANK = "search_rank"
+
+
+def _field(item, key: str):
+    return item[key] if isinstance(item, Mapping) else getattr(item, key)
+
 
 class BaseDAO:
     model = None
+    not_found_exception = RecordNotFoundException
+
+    _query_cache: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def _filter_shape(cls, filter_by: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        shape = []
+        for key, value in filter_by.items():
+            if isinstance(value, list):
+                shape.append((key, "one" if len(value) == 1 else "many"))
+            elif value == None:
+                pass
+            else:
+                shape.append((key, "scalar"))
+        return tuple(shape)
+
+    @classmethod
+    def _filter_params(cls, filter_by: Dict[str, Any]) -> Dict[str, Any]:
+        params = {}
+        for key, value in filter_by.items():
+            if isinstance(value, list):
+                params[f"f_{key}"] = value[0] if len(value) == 1 else value
+            elif value == None:
+                pass
+            else:
+                params[f"f_{key}"] = value
+        return params
+
+    @classmethod
+    def _data_columns(cls) -> List[Column]:
+        return [column for column in cls.model.__table__.c if column.computed is None]
+
+    @classmethod
+    def _tsquery(cls):
+        return func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), bindparam("_search", type_=String))
+
+    @classmethod
+    def _search_rank(cls):
+        return func.ts_rank_cd(cls.model.search_vector, cls._tsquery(), type_=REAL)
+
+    @classmethod
+    def _order_column(cls, order_by_column):
+        if order_by_column == SEARCH_RANK:
+            return cls._search_rank()
+        if isinstance(order_by_column, str):
+            order_column = getattr(cls.model, order_by_column, None)
+        elif isinstance(order_by_column, Column):
+            order_column = order_by_column
+        else:
+            raise ValueError("order_column либо строка либо колонка SQL")
+
+        if order_column is None:
+            raise ValueError(f"Колонка '{order_by_column}' не найдена в модели '{cls.model.__name__}'")
+
+        return order_column
+
+    @classmethod
+    def _build_query(
+            cls,
+            shape: Tuple[Tuple[str, str], ...],
+            order_by_column=None,
+            ascending: bool = True,
+            limit: bool = False,
+            offset: bool = False,
+            cursor: bool = False,
+            tiebreak: bool = False,
+            search: bool = False
+    ):
+        cache_key = (cls.model, shape, order_by_column, ascending, limit, offset, cursor, tiebreak, search)
+        query = cls._query_cache.get(cache_key)
+        if query is not None:
+            return query
+
+        query = select(cls.model)
+
+        for key, kind in shape:
+            column = getattr(cls.model, key, None)
+            if column is None:
+                raise ValueError(f"Колонка '{key}' не найдена в модели '{cls.model.__name__}'")
+
+            if kind == "many":
+                query = query.filter(column.in_(bindparam(f"f_{key}", expanding=True)))
+            else:
+                query = query.filter(column == bindparam(f"f_{key}"))
+
+        if search:
+            query = query.filter(cls.model.search_vector.bool_op("@@")(cls._tsquery()))
+
+        order_column = cls._order_column(order_by_column) if order_by_column else None
+        if order_column is not None:
+            query = query.order_by(asc(order_column) if ascending else desc(order_column))
+        if tiebreak:
+            query = query.order_by(asc(cls.model.id) if ascending else desc(cls.model.id))
+
+        if cursor:
+            last_id = bindparam("_cursor_id", type_=cls.model.id.type)
+            if order_column is not None:
+                key = tuple_(order_column, cls.model.id)
+                last_key = tuple_(bindparam("_cursor_value", type_=order_column.type), last_id)
+            else:
+                key, last_key = cls.model.id, last_id
+            query = query.filter(key > last_key if ascending else key < last_key)
+
+        if limit:
+            query = query.limit(bindparam("_limit", type_=Integer))
+        if offset:
+            query = query.offset(bindparam("_offset", type_=Integer))
+
+        cls._query_cache[cache_key] = query
+        return query
 
     @classmethod
     async def find_one(
@@ -17,39 +141,11 @@ class BaseDAO:
             **filter_by
     ):
         try:
-            query = select(cls.model)
-
-            for key, value in filter_by.items():
-                column = getattr(cls.model, key, None)
-                if column is None:
-                    raise ValueError(f"Колонка '{key}' не найдена в модели '{cls.model.__name__}'")
-
-                if isinstance(value, list):
-                    if len(value) == 1:
-                        query = query.filter(column == value[0])
-                    else:
-                        query = query.filter(column.in_(value))
-                elif value == None:
-                    pass
-                else:
-                    query = query.filter(column == value)
-
-            if order_by_column:
-                if isinstance(order_by_column, str):
-                    order_column = getattr(cls.model, order_by_column, None)
-                elif isinstance(order_by_column, Column):
-                    order_column = order_by_column
-                else:
-                    raise ValueError("order_column должен быть строкой или колонкой SQL")
-
-                if not order_column:
-                    raise ValueError(f"Колонка '{order_by_column}' не найдена в модели '{cls.model.__name__}'")
-
-                query = query.order_by(asc(order_column) if ascending else desc(order_column))
-
-            query = query.limit(1)
+            query = cls._build_query(cls._filter_shape(filter_by), order_by_column, ascending, limit=True)
+            params = cls._filter_params(filter_by)
+            params["_limit"] = 1
 
-            result = await session.execute(query)
+            result = await session.execute(query, params)
             return result.scalars().first()
 
         except SQLAlchemyError as e:
@@ -65,42 +161,53 @@ class BaseDAO:
             **filter_by
     ):
         try:
-            query = select(cls.model)
-
-            for key, value in filter_by.items():
-                column = getattr(cls.model, key, None)
-                if column is None:
-                    raise ValueError(f"Колонка '{key}' не найдена в модели '{cls.model.__name__}'")
-
-                if isinstance(value, list):
-                    if len(value) == 1:
-                        query = query.filter(column == value[0])
-                    else:
-                        query = query.filter(column.in_(value))
-                elif value == None:
-                    pass
-                else:
-                    query = query.filter(column == value)
-
-            if order_by_column:
-                if isinstance(order_by_column, str):
-                    order_column = getattr(cls.model, order_by_column, None)
-                elif isinstance(order_by_column, Column):
-                    order_column = order_by_column
-                else:
-                    raise ValueError("order_column либо строка либо колонка SQL")
-
-                if not order_column:
-                    raise ValueError(f"Колонка {order_column} не найдена в модели {cls.model.__name__}")
-
-                query = query.order_by(asc(order_column) if ascending else desc(order_column))
+            query = cls._build_query(cls._filter_shape(filter_by), order_by_column, ascending)
 
-            result = await session.execute(query)
+            result = await session.execute(query, cls._filter_params(filter_by))
             return result.scalars().all()
 
         except SQLAlchemyError as e:
             raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
 
+    @classmethod
+    def _page_query(
+            cls,
+            limit: int,
+            offset: int,
+            order_by_column,
+            ascending: bool,
+            cursor: Optional[str],
+            search: Optional[str],
+            filter_by: Dict[str, Any]
+    ):
+        # Поиск всегда ранжирует по релевантности, сортировка из запроса при этом не применяется
+        if search:
+            order_by_column, ascending = SEARCH_RANK, False
+
+        query = cls._build_query(
+            cls._filter_shape(filter_by),
+            order_by_column,
+            ascending,
+            limit=True,
+            offset=cursor is None,
+            cursor=cursor is not None,
+            tiebreak=True,
+            search=bool(search)
+        )
+        params = cls._filter_params(filter_by)
+        params["_limit"] = limit
+        if search:
+            params["_search"] = search
+
+        if cursor is None:
+            params["_offset"] = offset
+        else:
+            order_column = cls._order_column(order_by_column) if order_by_column else None
+            python_type = order_column.type.python_type if order_column is not None else None
+            params["_cursor_value"], params["_cursor_id"] = decode_cursor(cursor, python_type)
+
+        return query, params
+
     @classmethod
     async def find_with_filters(
             cls,
@@ -109,73 +216,228 @@ class BaseDAO:
             offset: int = 0,
             order_by_column=None,
             ascending: bool = True,
+            cursor: Optional[str] = None,
+            search: Optional[str] = None,
             **filter_by
     ):
         try:
-            query = select(cls.model).offset(offset).limit(limit)
-
-            for key, value in filter_by.items():
-                column = getattr(cls.model, key, None)
-                if column is None:
-                    raise ValueError(f"Колонка '{key}' не найдена в модели '{cls.model.__name__}'")
-
-                if isinstance(value, list):
-                    if len(value) == 1:
-                        query = query.filter(column == value[0])
-                    else:
-                        query = query.filter(column.in_(value))
-                elif value == None:
-                    pass
-                else:
-                    query = query.filter(column == value)
-
-            if order_by_column:
-                if isinstance(order_by_column, str):
-                    order_column = getattr(cls.model, order_by_column, None)
-                elif isinstance(order_by_column, Column):
-                    order_column = order_by_column
-                else:
-                    raise ValueError("order_column либо строка либо колонка SQL")
-
-                if not order_column:
-                    raise ValueError(f"Колонка {order_column} не найдена в модели {cls.model.__name__}")
-
-                query = query.order_by(asc(order_column) if ascending else desc(order_column))
-            result = await session.execute(query)
+            query, params = cls._page_query(limit, offset, order_by_column, ascending, cursor, search, filter_by)
+            result = await session.execute(query, params)
             return result.scalars().all()
 
         except SQLAlchemyError as e:
             raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
 
+    @classmethod
+    def _columns_query(cls, page_query, search: bool):
+        cache_key = ("columns", id(page_query))
+        query = cls._query_cache.get(cache_key)
+        if query is None:
+            columns = cls._data_columns()
+            if search:
+                columns.append(cls._search_rank().label(SEARCH_RANK))
+            query = page_query.with_only_columns(*columns)
+            cls._query_cache[cache_key] = query
+        return query
+
+    @classmethod
+    async def find_mappings_with_filters(
+            cls,
+            session: AsyncSession,
+            limit: int = 5,
+            offset: int = 0,
+            order_by_column=None,
+            ascending: bool = True,
+            cursor: Optional[str] = None,
+            search: Optional[str] = None,
+            **filter_by
+    ):
+        try:
+            query, params = cls._page_query(limit, offset, order_by_column, ascending, cursor, search, filter_by)
+            result = await session.execute(cls._columns_query(query, bool(search)), params)
+            return result.mappings().all()
+
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    async def stream_with_filters(
+            cls,
+            session: AsyncSession,
+            batch_size: int = 1000,
+            order_by_column=None,
+            **filter_by
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        # Серверный курсор: строки читаются пачками по batch_size без LIMIT/OFFSET и без накопления в памяти
+        query = cls._columns_query(
+            cls._build_query(cls._filter_shape(filter_by), order_by_column, tiebreak=True),
+            False
+        )
+        try:
+            result = await session.stream(
+                query, cls._filter_params(filter_by), execution_options={"yield_per": batch_size}
+            )
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+        async for rows in result.mappings().partitions(batch_size):
+            yield rows
+
+    @classmethod
+    def _fingerprint_query(cls, page_query):
+        cache_key = ("fingerprint", id(page_query))
+        query = cls._query_cache.get(cache_key)
+        if query is not None:
+            return query
+
+        page = page_query.subquery()
+        row_key = cast(page.c.id, String) + ":" + cast(page.c.version, String)
+        query = select(
+            func.count(),
+            func.max(page.c.updated_at),
+            func.md5(func.coalesce(func.string_agg(row_key, aggregate_order_by(literal(","), page.c.id)), "")),
+        )
+        cls._query_cache[cache_key] = query
+        return query
+
+    @classmethod
+    async def fingerprint_with_filters(
+            cls,
+            session: AsyncSession,
+            limit: int = 5,
+            offset: int = 0,
+            order_by_column=None,
+            ascending: bool = True,
+            cursor: Optional[str] = None,
+            search: Optional[str] = None,
+            **filter_by
+    ) -> Tuple[int, Any, str]:
+        try:
+            query, params = cls._page_query(limit, offset, order_by_column, ascending, cursor, search, filter_by)
+            result = await session.execute(cls._fingerprint_query(query), params)
+            return tuple(result.one())
+
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    def fingerprint(cls, items) -> Tuple[int, Any, str]:
+        rows = sorted((_field(item, "id"), _field(item, "version"), _field(item, "updated_at")) for item in items)
+        row_keys = ",".join(f"{row_id}:{version}" for row_id, version, _ in rows)
+        return (
+            len(rows),
+            max((updated_at for _, _, updated_at in rows), default=None),
+            hashlib.md5(row_keys.encode()).hexdigest(),
+        )
+
+    @classmethod
+    def next_cursor(
+            cls,
+            items,
+            limit: int,
+            order_by_column=None
+    ) -> Optional[str]:
+        if len(items) < limit:
+            return None
+
+        last = items[-1]
+        if isinstance(order_by_column, Column):
+            order_by_column = order_by_column.key
+        value = _field(last, order_by_column) if order_by_column else None
+        return encode_cursor(value, _field(last, "id"))
+
+    @classmethod
+    def _expire_loaded(cls, session: AsyncSession, ids: List[Any]) -> None:
+        # RETURNING не перезаписывает загруженные атрибуты объектов из identity map, в том числе
+        # onupdate-колонки вроде updated_at; истекшие атрибуты заполняются из возвращенных строк
+        ids = set(ids)
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, cls.model) and obj.id in ids:
+                session.expire(obj)
+
     @classmethod
     async def update_in_db(
             cls,
             session: AsyncSession,
             inst,
+            expected_version: Optional[int] = None,
             **data
     ):
-        async with async_session_maker() as session:
-            async with session.begin():
-                try:
-                    for key, value in data.items():
-                        if hasattr(inst, key):
-                            setattr(inst, key, value)
-                        else:
-                            raise ValueError(f"Поле '{key}' не существует в модели '{cls.model.__name__}'")
+        try:
+            for key in data:
+                if not hasattr(cls.model, key):
+                    raise ValueError(f"Поле '{key}' не существует в модели '{cls.model.__name__}'")
+
+            if hasattr(cls.model, 'version'):
+                data['version'] = cls.model.version + 1
+
+            record_id = inst.id
+            query = (
+                update(cls.model)
+                .where(cls.model.id == record_id)
+                .values(**data)
+                .returning(cls.model)
+                .execution_options(synchronize_session="fetch")
+            )
+            if expected_version is not None:
+                query = query.where(cls.model.version == expected_version)
+
+            cls._expire_loaded(session, [record_id])
+            result = await session.execute(query)
+            updated = result.scalars().one_or_none()
+            if updated is None:
+                # Запись могли удалить между чтением и записью: это 404, а 412 только для несовпавшей версии
+                if expected_version is not None and await session.scalar(
+                        select(cls.model.id).where(cls.model.id == record_id)) is not None:
+                    raise PreconditionFailedException()
+                raise cls.not_found_exception()
+            return updated
+
+        except HTTPException as e:
+            raise e
+        except IntegrityError as e:
+            raise HTTPException(status_code=400, detail=f"Ошибка обновления данных: {str(e)}")
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Внутренняя ошибка сервера: {str(e)}")
 
-                    if hasattr(inst, 'version'):
-                        inst.version += 1
 
-                    await session.merge(inst)
-                    return inst
+    @classmethod
+    async def update_many_in_db(
+            cls,
+            session: AsyncSession,
+            ids: List[Any],
+            **data
+    ):
+        if not ids:
+            return []
 
-                except IntegrityError as e:
-                    raise HTTPException(status_code=400, detail=f"Ошибка обновления данных: {str(e)}")
-                except SQLAlchemyError as e:
-                    raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
-                except Exception as e:
-                    raise HTTPException(status_code=500, detail=f"Внутренняя ошибка сервера: {str(e)}")
+        try:
+            for key in data:
+                if not hasattr(cls.model, key):
+                    raise ValueError(f"Поле '{key}' не существует в модели '{cls.model.__name__}'")
+
+            if hasattr(cls.model, 'version'):
+                data['version'] = cls.model.version + 1
+
+            query = (
+                update(cls.model)
+                .where(cls.model.id.in_(ids))
+                .values(**data)
+                .returning(cls.model)
+                .execution_options(synchronize_session="fetch")
+            )
+            cls._expire_loaded(session, ids)
+            result = await session.execute(query)
+            return result.scalars().all()
 
+        except IntegrityError as e:
+            raise HTTPException(status_code=400, detail=f"Ошибка обновления данных: {str(e)}")
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Внутренняя ошибка сервера: {str(e)}")
 
     @classmethod
     async def add_in_db(
@@ -184,7 +446,7 @@ class BaseDAO:
             **data
     ):
         try:
-            query = insert(cls.model).values(**data).returning(*cls.model.__table__.c)
+            query = insert(cls.model).values(**data).returning(*cls._data_columns())
             result = await session.execute(query)
             return result.mappings().one()
         except IntegrityError as e:
@@ -195,8 +457,47 @@ class BaseDAO:
             raise HTTPException(status_code=500, detail=f"Внутренняя ошибка сервера: {str(e)}")
 
 
+    @classmethod
+    async def add_many_in_db(
+            cls,
+            session: AsyncSession,
+            rows: List[Dict[str, Any]]
+    ):
+        if not rows:
+            return []
+
+        try:
+            query = insert(cls.model).returning(*cls._data_columns(), sort_by_parameter_order=True)
+            result = await session.execute(query, rows)
+            return result.mappings().all()
+        except IntegrityError as e:
+            raise HTTPException(status_code=400, detail=f"Ошибка вставки данных: {str(e)}")
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Внутренняя ошибка сервера: {str(e)}")
+
+
 class ArchiveDAO:
     model_archive = None
+    version_columns: Tuple[str, ...] = ("version",)
+    diff_columns: Tuple[str, ...] = ()
+
+    _archive_queries: Dict[Any, Any] = {}
+    _versions_queries: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def _archive_query(cls):
+        query = cls._archive_queries.get(cls.model_archive)
+        if query is None:
+            source = cls.model.__table__
+            columns = cls._data_columns()
+            query = insert(cls.model_archive.__table__).from_select(
+                ["archive_id", *[c.name for c in columns]],
+                select(func.gen_random_uuid(), *columns).where(source.c.id.in_(bindparam("ids", expanding=True)))
+            )
+            cls._archive_queries[cls.model_archive] = query
+        return query
 
     @classmethod
     async def archive(
@@ -204,14 +505,97 @@ class ArchiveDAO:
             session: AsyncSession,
             inst
     ):
+        await cls.archive_many(session, [inst.id])
+
+    @classmethod
+    async def archive_many(
+            cls,
+            session: AsyncSession,
+            ids: List[Any]
+    ):
+        if not ids:
+            return
+
         try:
-            inst_dict = {c.key: getattr(inst, c.key) for c in inspect(inst).mapper.column_attrs}
-            archive_inst = cls.model_archive(**inst_dict)
-            session.add(archive_inst)
-            return archive_inst
+            await session.execute(cls._archive_query(), {"ids": list(ids)})
         except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=f"Ошибка архивации данных: {str(e)}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Внутренняя ошибка сервера: {str(e)}")
 
+    @classmethod
+    def _versions_query(cls, cursor: bool):
+        cache_key = (cls.model_archive, cursor)
+        query = cls._versions_queries.get(cache_key)
+        if query is not None:
+            return query
+
+        branches = []
+        for table in (cls.model.__table__, cls.model_archive.__table__):
+            branch = select(*[table.c[name] for name in cls.version_columns]).where(table.c.id == bindparam("record_id"))
+            if cursor:
+                branch = branch.where(table.c.version < bindparam("_cursor_value", type_=Integer))
+            branches.append(branch)
+        versions = union_all(*branches).subquery()
+
+        query = select(versions).order_by(desc(versions.c.version)).limit(bindparam("_limit", type_=Integer))
+        if not cursor:
+            query = query.offset(bindparam("_offset", type_=Integer))
+
+        cls._versions_queries[cache_key] = query
+        return query
+
+    @classmethod
+    async def find_versions(
+            cls,
+            session: AsyncSession,
+            record_id: Any,
+            limit: int = 5,
+            offset: int = 0,
+            cursor: Optional[str] = None
+    ):
+        params = {"record_id": record_id, "_limit": limit}
+        if cursor is None:
+            params["_offset"] = offset
+        else:
+            params["_cursor_value"], _ = decode_cursor(cursor)
+            if not isinstance(params["_cursor_value"], int):
+                raise HTTPException(status_code=400, detail="Некорректный курсор пагинации")
 
+        try:
+            result = await session.execute(cls._versions_query(cursor is not None), params)
+            return result.mappings().all()
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    def next_versions_cursor(
+            cls,
+            versions,
+            limit: int,
+            record_id: Any
+    ) -> Optional[str]:
+        if len(versions) < limit:
+            return None
+        return encode_cursor(versions[-1]["version"], record_id)
+
+    @classmethod
+    async def find_version(
+            cls,
+            session: AsyncSession,
+            inst,
+            version: int
+    ):
+        if version == inst.version:
+            return inst
+
+        try:
+            query = (
+                select(cls.model_archive)
+                .where(cls.model_archive.id == inst.id, cls.model_archive.version == version)
+                .limit(1)
+            )
+            result = await session.execute(query)
+            return result.scalars().first()
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
@@ -1,15 +1,79 @@
+import time
+
+from fastapi import Request
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from src.config import POSTGRES_CONN
+from src.config import (
+    POSTGRES_CONN,
+    POSTGRES_REPLICA_CONN,
+    READ_YOUR_WRITES_WINDOW,
+    DB_POOL_SIZE,
+    DB_POOL_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_CACHE_SIZE
+)
+from src.utils.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_CHECKOUT_TIMEOUTS, instrument_engine
+from src.utils.read_routing import has_recent_write
 
 Base = declarative_base()
 
-engine = create_async_engine(POSTGRES_CONN)
+SEARCH_CONFIG = "russian"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', description), 'B')"
+)
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    # Метка метрик берется из pool_logging_name, который сохраняется при пересоздании пула
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(self.logging_name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(self.logging_name).observe(time.perf_counter() - start)
+
+
+def _create_engine(url: str, pool: str):
+    created = create_async_engine(
+        url,
+        poolclass=TimedAsyncQueuePool,
+        pool_logging_name=pool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_POOL_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args={"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE},
+    )
+    instrument_engine(created.sync_engine, DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW, pool)
+    return created
+
+
+engine = _create_engine(POSTGRES_CONN, "primary")
+read_engine = _create_engine(POSTGRES_REPLICA_CONN, "replica") if POSTGRES_REPLICA_CONN else engine
 
 async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_session_maker = sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
 
 async def get_async_session() -> AsyncSession:
     async with async_session_maker() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_read_session(request: Request) -> AsyncSession:
+    # Клиент, который только что писал, читает из основной базы, пока реплика может отставать
+    if has_recent_write(request.cookies, READ_YOUR_WRITES_WINDOW):
+        session_maker = async_session_maker
+    else:
+        session_maker = read_session_maker
+    async with session_maker() as session:
+        yield session
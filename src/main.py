@@ -1,15 +1,61 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from src.config import SERVER_ADDRESS
+from prometheus_client import CONTENT_TYPE_LATEST
+from src.config import (
+    SERVER_ADDRESS,
+    POSTGRES_DSN,
+    DB_QUERY_BUDGET,
+    DB_QUERY_REPEAT_THRESHOLD,
+    DB_QUERY_DEBUG,
+    ARCHIVE_KEEP_VERSIONS,
+    ARCHIVE_KEEP_DAYS,
+    ARCHIVE_COMPACTION_INTERVAL,
+    ARCHIVE_COMPACTION_BATCH,
+    ARCHIVE_PARTITIONS_AHEAD,
+    READ_YOUR_WRITES_WINDOW
+)
+from src.database import engine, read_engine
 
 from src.tenders.router import router as router_tenders
 from src.bids.router import router as router_bids
+from src.bids.dao import BidDAO
+from src.tenders.dao import TenderDAO
+from src.utils.archive_retention import ArchiveCompactor
+from src.utils.cache import CacheInvalidationListener
 from src.utils.custom_exceptions import ServerErrorException
 from src.utils.error_schemas import get_success_response_example_text, custom_500_response
+from src.utils.metrics import MetricsMiddleware, render_metrics, mark_worker_dead
+from src.utils.query_budget import QueryBudgetMiddleware
+from src.utils.read_routing import RecentWriteMiddleware
+
+cache_invalidation_listener = CacheInvalidationListener(POSTGRES_DSN)
+archive_compactor = ArchiveCompactor(
+    engine,
+    tables=[dao.model_archive.__tablename__ for dao in (TenderDAO, BidDAO)],
+    keep_versions=ARCHIVE_KEEP_VERSIONS,
+    keep_days=ARCHIVE_KEEP_DAYS,
+    interval=ARCHIVE_COMPACTION_INTERVAL,
+    batch_size=ARCHIVE_COMPACTION_BATCH,
+    partitions_ahead=ARCHIVE_PARTITIONS_AHEAD,
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await cache_invalidation_listener.start()
+    await archive_compactor.start()
+    yield
+    await archive_compactor.stop()
+    await cache_invalidation_listener.stop()
+    mark_worker_dead()
+
 
 app = FastAPI(title="Tender Management API",
+              lifespan=lifespan,
               root_path="/api",
               root_path_in_servers=False,
               description="API для управления тендерами и предложениями.\n\n"
@@ -30,6 +76,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    QueryBudgetMiddleware,
+    budget=DB_QUERY_BUDGET,
+    repeat_threshold=DB_QUERY_REPEAT_THRESHOLD,
+    server_timing=DB_QUERY_DEBUG,
+)
+app.add_middleware(MetricsMiddleware)
+if read_engine is not engine:
+    app.add_middleware(RecentWriteMiddleware, window=READ_YOUR_WRITES_WINDOW)
 
 @app.get("/ping",
          description=
@@ -50,6 +105,13 @@ async def check_ping():
     except Exception as _:
         raise ServerErrorException()
 
+@app.get("/metrics",
+         summary="Метрики Prometheus",
+         include_in_schema=False
+         )
+async def get_metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
 app.include_router(router_tenders)
 app.include_router(router_bids)
 
@@ -1,5 +1,16 @@
+import uuid
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import CACHE_MAXSIZE, CACHE_TTL
 from src.dao.base import BaseDAO
 from src.models.models import Organization, Employee, OrganizationResponsible
+from src.utils.cache import TTLCache, MISSING
+
+
+def detached_copy(inst):
+    return type(inst)(**{c.key: getattr(inst, c.key) for c in inspect(inst).mapper.column_attrs})
 
 
 class OrganizationDAO(BaseDAO):
@@ -7,6 +18,43 @@ class OrganizationDAO(BaseDAO):
 
 class EmployeeDAO(BaseDAO):
     model = Employee
+    cache = TTLCache(Employee.__tablename__, maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+
+    @classmethod
+    async def find_by_username(
+            cls,
+            session: AsyncSession,
+            username: str
+    ):
+        user = cls.cache.get(username)
+        if user is not MISSING:
+            return user
+
+        generation = cls.cache.generation
+        user = await cls.find_one(session, username=username)
+        if user is None:
+            return None
+
+        user = detached_copy(user)
+        cls.cache.set(username, user, generation)
+        return user
 
 class OrganizationResponsibleDAO(BaseDAO):
-    model = OrganizationResponsible
\ No newline at end of file
+    model = OrganizationResponsible
+    cache = TTLCache(OrganizationResponsible.__tablename__, maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+
+    @classmethod
+    async def find_by_user(
+            cls,
+            session: AsyncSession,
+            user_id: uuid.UUID
+    ):
+        key = str(user_id)
+        memberships = cls.cache.get(key)
+        if memberships is not MISSING:
+            return memberships
+
+        generation = cls.cache.generation
+        memberships = [detached_copy(m) for m in await cls.find_all(session, user_id=user_id)]
+        cls.cache.set(key, memberships, generation)
+        return memberships
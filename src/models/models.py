@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, TIMESTAMP, func, Text, ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, func, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import relationship
 from src.bids.models import *
@@ -40,6 +40,10 @@ class Organization(Base):
     responsibilities = relationship("OrganizationResponsible", back_populates="organization")
     tender_archives = relationship("TenderArchive", back_populates="organization")
 
+    __table_args__ = (
+        Index("ix_organization_name", "name"),
+    )
+
 class OrganizationResponsible(Base):
     __tablename__ = "organization_responsible"
 
@@ -50,3 +54,7 @@ class OrganizationResponsible(Base):
     # Relationships
     organization = relationship("Organization", back_populates="responsibilities")
     user = relationship("Employee", back_populates="responsibilities")
+
+    __table_args__ = (
+        Index("ix_organization_responsible_user_id_organization_id", "user_id", "organization_id"),
+    )
@@ -1,10 +1,82 @@
+from typing import List, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.dao.base import BaseDAO, ArchiveDAO
 from src.tenders.models import Tender, TenderArchive
+from src.utils.custom_exceptions import TenderNotFoundException
+
+IMPORT_COLUMNS = ("line", "name", "description", "status", "service_type",
+                  "organization_id", "creator_username", "created_at")
 
 
 class TenderDAO(BaseDAO, ArchiveDAO):
     model = Tender
     model_archive = TenderArchive
+    not_found_exception = TenderNotFoundException
+    version_columns = ("version", "name", "status", "service_type", "updated_at")
+    diff_columns = ("name", "description", "status", "service_type", "organization_id", "creator_username")
+
+    @classmethod
+    async def create_import_staging(
+            cls,
+            session: AsyncSession
+    ):
+        try:
+            await session.execute(text("""
+            CREATE TEMP TABLE tenders_import (
+                line integer NOT NULL,
+                name text NOT NULL,
+                description text NOT NULL,
+                status text NOT NULL,
+                service_type text NOT NULL,
+                organization_id uuid NOT NULL,
+                creator_username text NOT NULL,
+                created_at timestamp
+            ) ON COMMIT DROP
+            """))
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
+
+    @classmethod
+    async def copy_import_rows(
+            cls,
+            session: AsyncSession,
+            records: List[Tuple]
+    ):
+        if not records:
+            return
+
+        try:
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "tenders_import", records=records, columns=IMPORT_COLUMNS
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка загрузки данных: {str(e)}")
+
+    @classmethod
+    async def merge_import(
+            cls,
+            session: AsyncSession
+    ) -> int:
+        try:
+            result = await session.execute(text("""
+            INSERT INTO tenders (id, name, description, status, service_type, version,
+                                 organization_id, creator_username, created_at, updated_at)
+            SELECT gen_random_uuid(), name, description, CAST(status AS tenderstatus),
+                   CAST(service_type AS tenderservicetype), 1, organization_id, creator_username,
+                   COALESCE(created_at, now()), COALESCE(created_at, now())
+            FROM tenders_import
+            ORDER BY line
+            """))
+            return result.rowcount
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Ошибка выполнения запроса: {str(e)}")
 
 class TenderArchiveDAO(BaseDAO):
-    model = TenderArchive
\ No newline at end of file
+    model = TenderArchive
@@ -0,0 +1,163 @@
+import codecs
+import csv
+import json
+from datetime import timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.access.dao import AccessDAO
+from src.config import IMPORT_BATCH_SIZE
+from src.models.dao import OrganizationDAO
+from src.tenders.dao import TenderDAO
+from src.tenders.schemas import TenderImportRow, TenderImportError, TenderImportReport
+from src.utils.custom_exceptions import (
+    OrganizationNotFoundException,
+    UserNotFoundException,
+    ForbiddenActionException,
+)
+from src.utils.export import ExportFormat
+
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    # Инкрементальный декодер не ломает многобайтовые символы на границе чанков
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    number, tail = 0, ""
+    async for chunk in chunks:
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            number += 1
+            yield number, line.rstrip("\r")
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield number + 1, tail.rstrip("\r")
+
+
+async def _ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    async for number, line in _lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Некорректный JSON: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield number, None, "Ожидался JSON-объект"
+            continue
+        yield number, data, None
+
+
+async def _csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    header = None
+    record, start = "", 0
+    async for number, line in _lines(chunks):
+        if not record:
+            if not line.strip():
+                continue
+            start = number
+        record = f"{record}\n{line}" if record else line
+        # Поле в кавычках может содержать перевод строки: запись заканчивается на четном числе кавычек
+        if record.count('"') % 2:
+            continue
+
+        values = next(csv.reader([record]))
+        record = ""
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, None, f"Ожидалось полей: {len(header)}, получено: {len(values)}"
+            continue
+        yield start, {name: value for name, value in zip(header, values) if value != ""}, None
+
+    if record:
+        yield start, None, "Незакрытая кавычка в конце файла"
+
+
+def _validation_error(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+    )
+
+
+class _References:
+    def __init__(self):
+        self.organizations: Set[Any] = set()
+        self.checked_organizations: Set[Any] = set()
+        self.memberships: Dict[str, Set[Any]] = {}
+        self.checked_usernames: Set[str] = set()
+
+    async def load(self, session: AsyncSession, rows: List[Tuple[int, TenderImportRow]]):
+        # В базу уходят только ключи, которые еще не встречались в предыдущих пачках
+        organization_ids = {row.organization_id for _, row in rows} - self.checked_organizations
+        if organization_ids:
+            organizations = await OrganizationDAO.find_all(session, id=list(organization_ids))
+            self.organizations.update(org.id for org in organizations)
+            self.checked_organizations.update(organization_ids)
+
+        usernames = {row.creator_username for _, row in rows} - self.checked_usernames
+        if usernames:
+            self.memberships.update(await AccessDAO.resolve_memberships(session, usernames))
+            self.checked_usernames.update(usernames)
+
+    def error(self, row: TenderImportRow) -> Optional[str]:
+        if row.organization_id not in self.organizations:
+            return OrganizationNotFoundException().detail
+        if row.creator_username not in self.memberships:
+            return UserNotFoundException().detail
+        if row.organization_id not in self.memberships[row.creator_username]:
+            return ForbiddenActionException().detail
+        return None
+
+
+def _record(line: int, row: TenderImportRow) -> Tuple:
+    created_at = row.created_at
+    if created_at is not None and created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (line, row.name, row.description, row.status.value, row.service_type.value,
+            row.organization_id, row.creator_username, created_at)
+
+
+async def import_tenders(
+        session: AsyncSession,
+        chunks: AsyncIterator[bytes],
+        import_format: ExportFormat
+) -> TenderImportReport:
+    parsed = _csv_rows(chunks) if import_format == ExportFormat.csv else _ndjson_rows(chunks)
+    references = _References()
+    errors: List[TenderImportError] = []
+    batch: List[Tuple[int, TenderImportRow]] = []
+
+    async def flush():
+        await references.load(session, batch)
+        records = []
+        for line, row in batch:
+            error = references.error(row)
+            if error:
+                errors.append(TenderImportError(line=line, error=error))
+            else:
+                records.append(_record(line, row))
+        await TenderDAO.copy_import_rows(session, records)
+        batch.clear()
+
+    await TenderDAO.create_import_staging(session)
+    async for line, data, error in parsed:
+        if error is None:
+            try:
+                batch.append((line, TenderImportRow.model_validate(data)))
+            except ValidationError as e:
+                error = _validation_error(e)
+        if error is not None:
+            errors.append(TenderImportError(line=line, error=error))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await flush()
+    if batch:
+        await flush()
+
+    imported = await TenderDAO.merge_import(session)
+    errors.sort(key=lambda item: item.line)
+    return TenderImportReport(imported=imported, failed=len(errors), errors=errors)
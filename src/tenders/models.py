@@ -1,8 +1,10 @@
 import enum
 
-from sqlalchemy import Integer, Enum
+from sqlalchemy import Integer, Enum, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from src.models.models import *
-from src.database import Base
+from src.database import Base, SEARCH_VECTOR_SQL
 import uuid
 
 class TenderStatus(str, enum.Enum):
@@ -28,16 +30,26 @@ class Tender(Base):
     creator_username = Column(String(50), ForeignKey("employee.username"),nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=False))
 
     organization = relationship("Organization", back_populates="tenders")
     creator = relationship("Employee", back_populates="tenders")
     bids = relationship("Bid", back_populates="tenders")
     bids_archives = relationship("BidArchive", back_populates="tenders")
 
+    __table_args__ = (
+        Index("ix_tenders_status_name", "status", "name", "id"),
+        Index("ix_tenders_status_service_type_name", "status", "service_type", "name", "id"),
+        Index("ix_tenders_organization_id_name", "organization_id", "name", "id"),
+        Index("ix_tenders_creator_username_name", "creator_username", "name", "id"),
+        Index("ix_tenders_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 class TenderArchive(Base):
     __tablename__ = "tenders_archives"
 
-    archive_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True, unique=True)
+    archive_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    archived_at = Column(TIMESTAMP, primary_key=True, server_default=func.now(), nullable=False)
     id = Column(UUID(as_uuid=True), index=True)
     name = Column(String(100), nullable=False)
     description = Column(String(500), nullable=False)
@@ -50,4 +62,9 @@ class TenderArchive(Base):
     updated_at = Column(TIMESTAMP, nullable=False)
 
     organization = relationship("Organization", back_populates="tender_archives")
-    creator = relationship("Employee", back_populates="tender_archives")
\ No newline at end of file
+    creator = relationship("Employee", back_populates="tender_archives")
+
+    __table_args__ = (
+        Index("ix_tenders_archives_id_version", "id", "version"),
+        {"postgresql_partition_by": "RANGE (archived_at)"},
+    )
@@ -1,12 +1,23 @@
 import uuid
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response, Header, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.database import get_async_session
+from src.access.dao import AccessDAO
+from src.access.dependencies import get_tender_access
+from src.access.schemas import TenderAccess
+from src.bids.dao import BidStatsDAO
+from src.bids.models import TenderBidStats
+from src.config import RESPONSE_CACHE_BACKEND, RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL, RESPONSE_CACHE_DIR
+from src.dao.base import SEARCH_RANK
+from src.database import get_async_session, get_read_session
 from src.models.dao import OrganizationDAO, EmployeeDAO, OrganizationResponsibleDAO
 from src.tenders.dao import TenderDAO, TenderArchiveDAO
+from src.tenders.importer import import_tenders
 from src.tenders.schemas import (Tender, TenderServiceType, TenderCreate,
-                                 TenderResponse, TenderStatus, UpdateTenderRequest, TenderQueryType)
+                                 TenderResponse, TenderStatus, UpdateTenderRequest, TenderQueryType,
+                                 TenderBulkCreate, TenderBulkStatusUpdate, TenderBulkResult, TenderVersionSummary,
+                                 TenderStats, BidStatusCounts, DecisionStatusCounts, TenderImportReport)
 from src.utils.custom_exceptions import (
     OrganizationNotFoundException,
     UserNotFoundException,
@@ -20,13 +31,32 @@ from src.utils.error_schemas import (
     custom_403_response,
     custom_404_response_org,
     custom_404_response_tender,
-    custom_400_response
+    custom_400_response,
+    custom_304_response,
+    custom_412_response,
+    next_cursor_header,
+    etag_header
 )
+from src.utils.etag import make_etag, etag_matches, not_modified, expected_version
+from src.utils.export import ExportFormat, export_response, export_responses
+from src.utils.response_cache import create_response_cache
+from src.utils.serialization import json_response
+from src.utils.versions import VersionDiff, diff_versions
 
 router = APIRouter(
     prefix="/tenders"
 )
 
+# Публичный список одинаков для всех пользователей; триггер на tenders рассылает инвалидацию всем воркерам.
+# При чтении из отстающей реплики кэш согласован только с точностью до RESPONSE_CACHE_TTL
+published_tenders_cache = create_response_cache(
+    TenderDAO.model.__tablename__,
+    backend=RESPONSE_CACHE_BACKEND,
+    maxsize=RESPONSE_CACHE_MAXSIZE,
+    ttl=RESPONSE_CACHE_TTL,
+    directory=RESPONSE_CACHE_DIR,
+)
+
 
 @router.get("",
             summary="Получение списка тендеров",
@@ -36,12 +66,15 @@ router = APIRouter(
             responses={
                 200: {
                     "description": "Список тендеров, отсортированных по алфавиту по названию.",
+                    "headers": {**next_cursor_header, **etag_header},
                 },
+                304: custom_304_response,
                 422: custom_422_response,
                 500: custom_500_response
                 }
             )
 async def get_tenders(
+        response: Response,
         limit: int = Query(
             5,
             ge=1,
@@ -55,20 +88,57 @@ async def get_tenders(
             None,
             description="Вид услуги, к которой относится тендер."
                         " Доступные значения: Construction, Delivery, Manufacture."),
-        session: AsyncSession = Depends(get_async_session)
+        cursor: Optional[str] = Query(
+            None,
+            description="Курсор из заголовка X-Next-Cursor предыдущей страницы. Если задан, offset игнорируется."),
+        q: Optional[str] = Query(
+            None,
+            min_length=1,
+            max_length=200,
+            description="Поисковый запрос по названию и описанию тендера. Если задан, результаты сортируются по релевантности."),
+        if_none_match: Optional[str] = Header(None),
+        session: AsyncSession = Depends(get_read_session)
 ):
+    cache_key = (limit, None if cursor else offset, tuple(sorted({item.value for item in service_type or []})), cursor, q)
+    cached = published_tenders_cache.get(cache_key)
+    if cached is not None:
+        if if_none_match and etag_matches(if_none_match, cached.headers["etag"]):
+            return not_modified(cached.headers["etag"])
+        return cached.to_response()
+    generation = published_tenders_cache.generation
+
     async with session.begin():
         try:
-            return await TenderDAO.find_with_filters(
-                session,
+            filters = dict(
                 limit=limit,
                 offset=offset,
                 order_by_column="name",
                 ascending=True,
+                cursor=cursor,
+                search=q,
                 service_type=service_type,
                 status=TenderStatus.Published
             )
 
+            if if_none_match:
+                etag = make_etag(*await TenderDAO.fingerprint_with_filters(session, **filters))
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            tenders = await TenderDAO.find_mappings_with_filters(session, **filters)
+            response.headers["ETag"] = make_etag(*TenderDAO.fingerprint(tenders))
+
+            next_cursor = TenderDAO.next_cursor(tenders, limit, SEARCH_RANK if q else "name")
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+
+            result = json_response(List[Tender], tenders, response)
+            published_tenders_cache.set(cache_key, result, generation)
+            return result
+
+        except HTTPException as e:
+            raise e
+
         except Exception as _:
             raise ServerErrorException()
 
@@ -100,15 +170,12 @@ async def create_tender(
             if not org:
                 raise OrganizationNotFoundException()
 
-            user = await EmployeeDAO.find_one(session, username=new_tender.creator_username)
+            user = await EmployeeDAO.find_by_username(session, new_tender.creator_username)
             if not user:
                 raise UserNotFoundException()
 
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=new_tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            org_resp = await OrganizationResponsibleDAO.find_by_user(session, user.id)
+            if not any(org.organization_id == new_tender.organization_id for org in org_resp):
                 raise ForbiddenActionException()
 
             result = await TenderDAO.add_in_db(
@@ -121,9 +188,190 @@ async def create_tender(
                 creator_username=new_tender.creator_username,
             )
 
-            return result
+            return json_response(TenderResponse, result)
+        except HTTPException as e:
+            raise e
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.post("/bulk",
+             summary="Пакетное создание тендеров",
+             description="Создание нескольких тендеров одним запросом. "
+                         "Организации и права создателей проверяются для всех тендеров сразу, "
+                         "корректные тендеры вставляются одной операцией. "
+                         "Для каждого тендера возвращается отдельный результат.",
+             response_model=List[TenderBulkResult],
+             responses={
+                 200: {
+                     "description": "Результаты создания тендеров в порядке запроса.",
+                 },
+                 422: custom_422_response,
+                 500: custom_500_response
+             }
+             )
+async def create_tenders_bulk(
+        new_tenders: TenderBulkCreate,
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            organizations = await OrganizationDAO.find_all(
+                session,
+                id=list({tender.organization_id for tender in new_tenders.tenders}))
+            organization_ids = {org.id for org in organizations}
+
+            memberships = await AccessDAO.resolve_memberships(
+                session,
+                [tender.creator_username for tender in new_tenders.tenders])
+
+            results = {}
+            valid = []
+            for index, new_tender in enumerate(new_tenders.tenders):
+                error = None
+                if new_tender.organization_id not in organization_ids:
+                    error = OrganizationNotFoundException()
+                elif new_tender.creator_username not in memberships:
+                    error = UserNotFoundException()
+                elif new_tender.organization_id not in memberships[new_tender.creator_username]:
+                    error = ForbiddenActionException()
+
+                if error:
+                    results[index] = TenderBulkResult(index=index, status_code=error.status_code, error=error.detail)
+                else:
+                    valid.append(index)
+
+            created = await TenderDAO.add_many_in_db(
+                session,
+                [
+                    {
+                        "name": new_tenders.tenders[index].name,
+                        "description": new_tenders.tenders[index].description,
+                        "status": "Created",
+                        "service_type": new_tenders.tenders[index].service_type,
+                        "organization_id": new_tenders.tenders[index].organization_id,
+                        "creator_username": new_tenders.tenders[index].creator_username,
+                    }
+                    for index in valid
+                ]
+            )
+            for index, tender in zip(valid, created):
+                results[index] = TenderBulkResult(index=index, status_code=200, tender=TenderResponse.model_validate(tender))
+
+            return [results[index] for index in range(len(new_tenders.tenders))]
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.patch("/bulk/status",
+              summary="Пакетное изменение статуса тендеров",
+              description="Перевод нескольких тендеров в новый статус. "
+                          "Текущие версии архивируются одной операцией INSERT ... SELECT, "
+                          "статус и версия обновляются одним UPDATE в той же транзакции. "
+                          "Для каждого тендера возвращается отдельный результат.",
+              response_model=List[TenderBulkResult],
+              responses={
+                  200: {
+                      "description": "Результаты изменения статуса в порядке запроса.",
+                  },
+                  401: custom_401_response,
+                  422: custom_422_response,
+                  500: custom_500_response
+              }
+              )
+async def edit_tenders_status_bulk(
+        update_data: TenderBulkStatusUpdate,
+        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            accesses = await AccessDAO.resolve_tenders(session, username=username, tender_ids=update_data.tender_ids)
+            if accesses is None:
+                raise UserNotFoundException()
+            access_by_id = {access.tender.id: access for access in accesses}
+
+            results = {}
+            valid = {}
+            for index, tender_id in enumerate(update_data.tender_ids):
+                access = access_by_id.get(tender_id)
+                error = None
+                if not access:
+                    error = TenderNotFoundException()
+                elif not access.is_responsible:
+                    error = ForbiddenActionException()
+                elif access.tender.status == update_data.status:
+                    error = HTTPException(status_code=400, detail="Новый статус не может быть таким же, как и текущий")
+                elif tender_id in valid:
+                    error = HTTPException(status_code=400, detail="Тендер указан в запросе повторно")
+
+                if error:
+                    results[index] = TenderBulkResult(index=index, status_code=error.status_code, error=error.detail)
+                else:
+                    valid[tender_id] = index
+
+            await TenderDAO.archive_many(session, list(valid))
+            updated = await TenderDAO.update_many_in_db(session, list(valid), status=update_data.status)
+            if updated:
+                published_tenders_cache.invalidate_after_commit(session)
+            for tender in updated:
+                index = valid[tender.id]
+                results[index] = TenderBulkResult(index=index, status_code=200, tender=TenderResponse.model_validate(tender, from_attributes=True))
+
+            return [results[index] for index in range(len(update_data.tender_ids))]
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.post("/import",
+             summary="Импорт тендеров из файла",
+             description="Загрузка тендеров из CSV (первая строка - заголовок) или NDJSON. "
+                         "Тело читается потоком, организации и права создателей проверяются пачками, "
+                         "корректные строки загружаются через COPY во временную таблицу и переносятся "
+                         "в тендеры одним INSERT ... SELECT. Для некорректных строк возвращается номер строки и причина.",
+             response_model=TenderImportReport,
+             responses={
+                 200: {
+                     "description": "Отчет об импорте: число загруженных и отклоненных строк.",
+                 },
+                 422: custom_422_response,
+                 500: custom_500_response
+             },
+             openapi_extra={
+                 "requestBody": {
+                     "required": True,
+                     "content": {
+                         "text/csv": {"schema": {"type": "string"}},
+                         "application/x-ndjson": {"schema": {"type": "string"}},
+                     },
+                 }
+             }
+             )
+async def import_tenders_file(
+        request: Request,
+        format: ExportFormat = Query(
+            ExportFormat.csv,
+            description="Формат файла: csv или ndjson."),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            report = await import_tenders(session, request.stream(), format)
+            if report.imported:
+                published_tenders_cache.invalidate_after_commit(session)
+            return json_response(TenderImportReport, report)
+
         except HTTPException as e:
             raise e
+
         except Exception as _:
             raise ServerErrorException()
 
@@ -135,13 +383,16 @@ async def create_tender(
             responses={
                 200: {
                     "description": "Список тендеров пользователя, отсортированный по алфавиту.",
+                    "headers": {**next_cursor_header, **etag_header},
                 },
+                304: custom_304_response,
                 401: custom_401_response,
                 422: custom_422_response,
                 500: custom_500_response
             }
             )
 async def get_my_tenders(
+        response: Response,
         limit: int = Query(
             5,
             ge=1,
@@ -162,41 +413,106 @@ async def get_my_tenders(
         query_type: Optional[TenderQueryType] = Query(
             None,
             description="Тип запроса тендеров. Варианты: 'author', 'responsible', responsible по умолчанию."),
-        session: AsyncSession = Depends(get_async_session)
+        cursor: Optional[str] = Query(
+            None,
+            description="Курсор из заголовка X-Next-Cursor предыдущей страницы. Если задан, offset игнорируется."),
+        q: Optional[str] = Query(
+            None,
+            min_length=1,
+            max_length=200,
+            description="Поисковый запрос по названию и описанию тендера. Если задан, результаты сортируются по релевантности."),
+        if_none_match: Optional[str] = Header(None),
+        session: AsyncSession = Depends(get_read_session)
 ):
     async with session.begin():
         try:
             if query_type is None:
                 query_type = TenderQueryType.RESPONSIBLE
-            user = await EmployeeDAO.find_one(session, username=username)
+            user = await EmployeeDAO.find_by_username(session, username)
             if not user:
                 raise UserNotFoundException()
 
+            filters = dict(
+                limit=limit,
+                offset=offset,
+                order_by_column="name",
+                ascending=True,
+                cursor=cursor,
+                search=q,
+                service_type=service_type
+            )
+
             if query_type == TenderQueryType.AUTHOR:
-                tenders = await TenderDAO.find_with_filters(
-                    session,
-                    limit=limit,
-                    offset=offset,
-                    order_by_column="name",
-                    ascending=True,
-                    service_type=service_type,
-                    creator_username=user.username
-                )
+                filters["creator_username"] = user.username
 
             if query_type == TenderQueryType.RESPONSIBLE:
-                org_resp = await OrganizationResponsibleDAO.find_all(session, user_id=user.id)
+                org_resp = await OrganizationResponsibleDAO.find_by_user(session, user.id)
                 org_ids = [org.organization_id for org in org_resp]
                 if not org_ids:
                     return []
-                tenders = await TenderDAO.find_with_filters(
-                    session,
-                    limit=limit,
-                    offset=offset,
-                    organization_id=org_ids,
-                    service_type=service_type
-                )
+                filters["organization_id"] = org_ids
+
+            if if_none_match:
+                etag = make_etag(*await TenderDAO.fingerprint_with_filters(session, **filters))
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+            tenders = await TenderDAO.find_mappings_with_filters(session, **filters)
+            response.headers["ETag"] = make_etag(*TenderDAO.fingerprint(tenders))
+
+            next_cursor = TenderDAO.next_cursor(tenders, limit, SEARCH_RANK if q else "name")
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+
+            return json_response(List[TenderResponse], tenders, response)
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.get("/export",
+            summary="Выгрузка тендеров организации",
+            description="Потоковая выгрузка всех тендеров организации в NDJSON или CSV. "
+                        "Строки читаются серверным курсором пачками, без пагинации и повторных запросов.",
+            response_class=StreamingResponse,
+            responses={
+                200: export_responses,
+                401: custom_401_response,
+                403: custom_403_response,
+                404: custom_404_response_org,
+                422: custom_422_response,
+                500: custom_500_response
+            }
+            )
+async def export_tenders(
+        organization_id: uuid.UUID = Query(
+            ...,
+            description="Организация, тендеры которой выгружаются."),
+        username: str = Query(
+            ...,
+            max_length=50,
+            description="Имя пользователя, ответственного за организацию"),
+        format: ExportFormat = Query(
+            ExportFormat.ndjson,
+            description="Формат выгрузки: ndjson или csv."),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            user = await EmployeeDAO.find_by_username(session, username)
+            if not user:
+                raise UserNotFoundException()
+
+            org = await OrganizationDAO.find_one(session, id=organization_id)
+            if not org:
+                raise OrganizationNotFoundException()
 
-            return tenders
+            org_resp = await OrganizationResponsibleDAO.find_by_user(session, user.id)
+            if not any(resp.organization_id == organization_id for resp in org_resp):
+                raise ForbiddenActionException()
 
         except HTTPException as e:
             raise e
@@ -204,6 +520,8 @@ async def get_my_tenders(
         except Exception as _:
             raise ServerErrorException()
 
+    return export_response(TenderDAO, TenderResponse, format, f"tenders_{organization_id}", organization_id=organization_id)
+
 
 @router.get(
     "/{tender_id}/status",
@@ -213,7 +531,9 @@ async def get_my_tenders(
     responses={
         200: {
             "description": "Текущий статус тендера.",
+            "headers": etag_header,
         },
+        304: custom_304_response,
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_tender,
@@ -223,31 +543,73 @@ async def get_my_tenders(
 )
 async def get_tender_status(
         tender_id: uuid.UUID,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_none_match: Optional[str] = Header(None),
+        access: TenderAccess = Depends(get_tender_access)
+):
+    try:
+        tender = access.tender
+
+        if tender.status != "Published" and not access.is_responsible:
+            raise ForbiddenActionException()
+
+        etag = make_etag(tender.id, tender.version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        response.headers["ETag"] = etag
+        return tender.status
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as _:
+        raise ServerErrorException()
+
+
+@router.get(
+    "/{tender_id}/stats",
+    summary="Статистика предложений по тендеру",
+    description="Число предложений по статусам и решениям и время последней активности. "
+                "Значения берутся из сводной таблицы, которая обновляется в той же транзакции, что и предложения.",
+    response_model=TenderStats,
+    responses={
+        200: {
+            "description": "Статистика предложений по тендеру.",
+        },
+        401: custom_401_response,
+        403: custom_403_response,
+        404: custom_404_response_tender,
+        422: custom_422_response,
+        500: custom_500_response
+    }
+)
+async def get_tender_stats(
+        tender_id: uuid.UUID,
+        access: TenderAccess = Depends(get_tender_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            tender = await TenderDAO.find_one(session, id=tender_id)
-            if not tender:
-                raise TenderNotFoundException()
-
-            if tender.status == "Published":
-                return tender.status
+            if not access.is_responsible:
+                raise ForbiddenActionException()
 
-            else:
-                user_verification = await OrganizationResponsibleDAO.find_one(
-                    session,
-                    organization_id=tender.organization_id,
-                    user_id=user.id)
-                if not user_verification:
-                    raise ForbiddenActionException()
+            stats = await BidStatsDAO.find_one(session, tender_id=tender_id)
+            if not stats:
+                stats = TenderBidStats(
+                    tender_id=tender_id, bids_total=0, created=0, published=0, canceled=0,
+                    pending=0, approved=0, rejected=0
+                )
 
-                return tender.status
+            return TenderStats(
+                tender_id=stats.tender_id,
+                bids_total=stats.bids_total,
+                status=BidStatusCounts(Created=stats.created, Published=stats.published, Canceled=stats.canceled),
+                decision_status=DecisionStatusCounts(
+                    Pending=stats.pending, Approved=stats.approved, Rejected=stats.rejected
+                ),
+                last_activity_at=stats.last_activity_at
+            )
 
         except HTTPException as e:
             raise e
@@ -264,11 +626,13 @@ async def get_tender_status(
     responses={
         200: {
             "description": "Статус тендера успешно изменен.",
+            "headers": etag_header,
         },
         400: custom_400_response,
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_tender,
+        412: custom_412_response,
         422: custom_422_response,
         500: custom_500_response
     }
@@ -276,26 +640,19 @@ async def get_tender_status(
 async def edit_tender_status(
         tender_id: uuid.UUID,
         new_status: TenderStatus,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        access: TenderAccess = Depends(get_tender_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            tender = await TenderDAO.find_one(session, id=tender_id)
-            if not tender:
-                raise TenderNotFoundException()
-
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            tender = access.tender
+            if not access.is_responsible:
                 raise ForbiddenActionException()
 
+            expected = expected_version(if_match, tender)
+
             if tender.status == new_status:
                 raise HTTPException(status_code=400, detail="Новый статус не может быть таким же, как и текущий")
 
@@ -303,9 +660,11 @@ async def edit_tender_status(
 
             update_data = {"status": new_status}
 
-            result = await TenderDAO.update_in_db(session, tender, **update_data)
+            result = await TenderDAO.update_in_db(session, tender, expected_version=expected, **update_data)
+            published_tenders_cache.invalidate_after_commit(session)
 
-            return TenderResponse.from_orm(result)
+            response.headers["ETag"] = make_etag(result.id, result.version)
+            return json_response(TenderResponse, result, response)
 
         except HTTPException as e:
             raise e
@@ -322,11 +681,13 @@ async def edit_tender_status(
     responses={
         200: {
             "description": "Тендер успешно изменен и возвращает обновленную информацию.",
+            "headers": etag_header,
         },
         400: custom_400_response,
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_tender,
+        412: custom_412_response,
         422: custom_422_response,
         500: custom_500_response
     }
@@ -334,26 +695,19 @@ async def edit_tender_status(
 async def edit_tender(
         tender_id: uuid.UUID,
         update_data: UpdateTenderRequest,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        access: TenderAccess = Depends(get_tender_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            tender = await TenderDAO.find_one(session, id=tender_id)
-            if not tender:
-                raise TenderNotFoundException()
-
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            tender = access.tender
+            if not access.is_responsible:
                 raise ForbiddenActionException()
 
+            expected = expected_version(if_match, tender)
+
             await TenderDAO.archive(session, tender)
 
             if update_data.name is None:
@@ -367,9 +721,11 @@ async def edit_tender(
 
             update_data_dict = update_data.dict(exclude_unset=True)
 
-            result = await TenderDAO.update_in_db(session, tender, **update_data_dict)
+            result = await TenderDAO.update_in_db(session, tender, expected_version=expected, **update_data_dict)
+            published_tenders_cache.invalidate_after_commit(session)
 
-            return TenderResponse.from_orm(result)
+            response.headers["ETag"] = make_etag(result.id, result.version)
+            return json_response(TenderResponse, result, response)
 
         except HTTPException as e:
             raise e
@@ -387,11 +743,13 @@ async def edit_tender(
     responses={
         200: {
             "description": "Тендер успешно откатан и версия инкрементирована.",
+            "headers": etag_header,
         },
         400: custom_400_response,
         401: custom_401_response,
         403: custom_403_response,
         404: custom_404_response_tender,
+        412: custom_412_response,
         422: custom_422_response,
         500: custom_500_response
     }
@@ -399,26 +757,19 @@ async def edit_tender(
 async def rollback_tender(
         tender_id: uuid.UUID,
         version: int,
-        username: str = Query("test_user", max_length=50, description="username пользователя"),
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        access: TenderAccess = Depends(get_tender_access),
         session: AsyncSession = Depends(get_async_session)
 ):
     async with session.begin():
         try:
-            user = await EmployeeDAO.find_one(session, username=username)
-            if not user:
-                raise UserNotFoundException()
-
-            tender = await TenderDAO.find_one(session, id=tender_id)
-            if not tender:
-                raise TenderNotFoundException()
-
-            user_verification = await OrganizationResponsibleDAO.find_one(
-                session,
-                organization_id=tender.organization_id,
-                user_id=user.id)
-            if not user_verification:
+            tender = access.tender
+            if not access.is_responsible:
                 raise ForbiddenActionException()
 
+            expected = expected_version(if_match, tender)
+
             archive_tender = await TenderArchiveDAO.find_one(session, id=tender_id, version=version)
             if not archive_tender:
                 raise HTTPException(status_code=404, detail="Указанная версия тендера не найдена в архиве")
@@ -428,7 +779,6 @@ async def rollback_tender(
                 "description": archive_tender.description,
                 "status": archive_tender.status,
                 "service_type": archive_tender.service_type,
-                "version": tender.version,
                 "organization_id": archive_tender.organization_id,
                 "creator_username": archive_tender.creator_username,
                 "created_at": archive_tender.created_at
@@ -436,9 +786,110 @@ async def rollback_tender(
 
             await TenderDAO.archive(session, tender)
 
-            result = await TenderDAO.update_in_db(session, tender, **update_data_dict)
+            result = await TenderDAO.update_in_db(session, tender, expected_version=expected, **update_data_dict)
+            published_tenders_cache.invalidate_after_commit(session)
+
+            response.headers["ETag"] = make_etag(result.id, result.version)
+            return json_response(TenderResponse, result, response)
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.get(
+    "/{tender_id}/versions",
+    summary="История версий тендера",
+    description="Список версий тендера, начиная с текущей, в порядке убывания номера версии.",
+    response_model=List[TenderVersionSummary],
+    responses={
+        200: {
+            "description": "Краткие сведения о версиях тендера.",
+            "headers": next_cursor_header,
+        },
+        400: custom_400_response,
+        401: custom_401_response,
+        403: custom_403_response,
+        404: custom_404_response_tender,
+        422: custom_422_response,
+        500: custom_500_response
+    }
+)
+async def get_tender_versions(
+        response: Response,
+        tender_id: uuid.UUID,
+        limit: int = Query(
+            5,
+            ge=1,
+            le=100,
+            description="Максимальное число возвращаемых объектов."),
+        offset: int = Query(
+            0,
+            ge=0,
+            description="Количество объектов, пропущенных с начала."),
+        cursor: Optional[str] = Query(
+            None,
+            description="Курсор из заголовка X-Next-Cursor предыдущей страницы. Если задан, offset игнорируется."),
+        access: TenderAccess = Depends(get_tender_access),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            if not access.is_responsible:
+                raise ForbiddenActionException()
+
+            versions = await TenderDAO.find_versions(session, tender_id, limit=limit, offset=offset, cursor=cursor)
+
+            next_cursor = TenderDAO.next_versions_cursor(versions, limit, tender_id)
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+
+            return versions
+
+        except HTTPException as e:
+            raise e
+
+        except Exception as _:
+            raise ServerErrorException()
+
+
+@router.get(
+    "/{tender_id}/versions/diff",
+    summary="Сравнение версий тендера",
+    description="Список полей тендера, отличающихся между двумя версиями.",
+    response_model=VersionDiff,
+    responses={
+        200: {
+            "description": "Изменения между версиями.",
+        },
+        401: custom_401_response,
+        403: custom_403_response,
+        404: custom_404_response_tender,
+        422: custom_422_response,
+        500: custom_500_response
+    }
+)
+async def get_tender_versions_diff(
+        tender_id: uuid.UUID,
+        version_from: int = Query(..., ge=1, description="Исходная версия."),
+        version_to: Optional[int] = Query(None, ge=1, description="Конечная версия, по умолчанию текущая."),
+        access: TenderAccess = Depends(get_tender_access),
+        session: AsyncSession = Depends(get_async_session)
+):
+    async with session.begin():
+        try:
+            tender = access.tender
+            if not access.is_responsible:
+                raise ForbiddenActionException()
+
+            old = await TenderDAO.find_version(session, tender, version_from)
+            new = await TenderDAO.find_version(session, tender, version_to or tender.version)
+            if not old or not new:
+                raise HTTPException(status_code=404, detail="Указанная версия тендера не найдена в архиве")
 
-            return TenderResponse.from_orm(result)
+            return diff_versions(old, new, TenderDAO.diff_columns)
 
         except HTTPException as e:
             raise e
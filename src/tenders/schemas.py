@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -94,6 +94,63 @@ class TenderResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TenderBulkCreate(BaseModel):
+    tenders: List[TenderCreate] = Field(..., min_length=1, max_length=1000)
+
+class TenderBulkStatusUpdate(BaseModel):
+    tender_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+    status: TenderStatus = Field(..., example="Published")
+
+class TenderBulkResult(BaseModel):
+    index: int = Field(..., example=0, description="Позиция элемента в запросе")
+    status_code: int = Field(..., example=200)
+    tender: Optional[TenderResponse] = None
+    error: Optional[str] = Field(None, example="Тендер не существует")
+
+class TenderVersionSummary(BaseModel):
+    version: int = Field(..., example=2)
+    name: str = Field(..., example="Доставка товары Казань - Москва")
+    status: TenderStatus = Field(..., example="Published")
+    service_type: TenderServiceType = Field(..., example="Delivery")
+    updated_at: datetime = Field(..., example="2006-01-02T15:04:05Z07:00")
+
+class TenderImportRow(TenderCreate):
+    name: str = Field(..., max_length=100)
+    description: str = Field(..., max_length=500)
+    creator_username: str = Field(..., max_length=50)
+    status: TenderStatus = Field(TenderStatus.Created, example="Created")
+    created_at: Optional[datetime] = Field(None, example="2006-01-02T15:04:05Z07:00")
+
+class TenderImportError(BaseModel):
+    line: int = Field(..., example=3, description="Номер строки во входном файле")
+    error: str = Field(..., example="Организация не существует")
+
+class TenderImportReport(BaseModel):
+    imported: int = Field(..., example=998)
+    failed: int = Field(..., example=2)
+    errors: List[TenderImportError]
+
+class BidStatusCounts(BaseModel):
+    Created: int = Field(..., example=2)
+    Published: int = Field(..., example=5)
+    Canceled: int = Field(..., example=1)
+
+class DecisionStatusCounts(BaseModel):
+    Pending: int = Field(..., example=6)
+    Approved: int = Field(..., example=1)
+    Rejected: int = Field(..., example=1)
+
+class TenderStats(BaseModel):
+    tender_id: UUID = Field(..., example="550e8400-e29b-41d4-a716-446655440000")
+    bids_total: int = Field(..., example=8, description="Общее число предложений по тендеру")
+    status: BidStatusCounts = Field(..., description="Число предложений по статусам")
+    decision_status: DecisionStatusCounts = Field(..., description="Число предложений по решениям")
+    last_activity_at: Optional[datetime] = Field(
+        None,
+        example="2006-01-02T15:04:05Z07:00",
+        description="Время последнего создания или изменения предложения. Отсутствует, если предложений не было."
+    )
+
 class TenderQueryType(Enum):
     AUTHOR = "author"
     RESPONSIBLE = "responsible"
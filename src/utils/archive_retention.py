@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.utils.metrics import ARCHIVE_ROWS_REMOVED, ARCHIVE_PARTITIONS_DROPPED
+
+logger = logging.getLogger(__name__)
+
+COMPACTION_LOCK_ID = 0x61726368
+
+PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+PARTITIONS_SQL = text("""
+SELECT c.relname
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = CAST(:parent AS regclass)
+""")
+
+
+def _month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(month: datetime) -> datetime:
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+class ArchiveCompactor:
+    def __init__(
+            self,
+            engine: AsyncEngine,
+            tables: List[str],
+            keep_versions: int,
+            keep_days: int,
+            interval: float,
+            batch_size: int,
+            partitions_ahead: int
+    ):
+        self.engine = engine
+        self.tables = tables
+        self.keep_versions = keep_versions
+        self.keep_days = keep_days
+        self.interval = interval
+        self.batch_size = batch_size
+        self.partitions_ahead = partitions_ahead
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.compact()
+            except Exception as e:
+                logger.warning("Не удалось выполнить компакцию архивов: %s", e)
+            await asyncio.sleep(self.interval)
+
+    async def compact(self) -> Dict[str, int]:
+        async with self.engine.connect() as connection:
+            locked = await connection.scalar(text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": COMPACTION_LOCK_ID})
+            await connection.commit()
+            if not locked:
+                return {}
+
+            try:
+                removed = {}
+                for table in self.tables:
+                    await self._ensure_partitions(connection, table)
+                    await self._drop_partitions(connection, table)
+                    removed[table] = await self._apply_retention(connection, table)
+                    if removed[table]:
+                        await self._drop_partitions(connection, table)
+                return removed
+            finally:
+                await connection.rollback()
+                await connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": COMPACTION_LOCK_ID})
+                await connection.commit()
+
+    async def _ensure_partitions(self, connection: AsyncConnection, table: str) -> None:
+        await connection.execute(
+            text("""
+            SELECT ensure_archive_partition(:table, date_trunc('month', now()) + make_interval(months => m))
+            FROM generate_series(0, :ahead) AS m
+            """),
+            {"table": table, "ahead": self.partitions_ahead}
+        )
+        await connection.commit()
+
+    def _doomed_query(self, table: str) -> Optional[str]:
+        expired = "archived_at < now() - make_interval(days => :keep_days)"
+        if self.keep_versions == 0:
+            # Без лимита по числу версий ранжирование не нужно, условие по archived_at отсекает секции
+            return f"SELECT archive_id, archived_at FROM {table} WHERE {expired}" if self.keep_days > 0 else None
+
+        conditions = ["position > :keep_versions"]
+        if self.keep_days > 0:
+            conditions.append(expired)
+        return f"""
+        SELECT archive_id, archived_at
+        FROM (
+            SELECT archive_id, archived_at,
+                   row_number() OVER (PARTITION BY id ORDER BY version DESC) AS position
+            FROM {table}
+        ) AS ranked
+        WHERE {" AND ".join(conditions)}
+        """
+
+    async def _apply_retention(self, connection: AsyncConnection, table: str) -> int:
+        doomed = self._doomed_query(table)
+        if doomed is None:
+            return 0
+
+        # Набор удаляемых версий вычисляется один раз: новые версии только сдвигают старые дальше от начала,
+        # поэтому отобранные строки остаются вне политики хранения, и пачки удаляются по номеру без повторного ранжирования
+        await connection.execute(text("DROP TABLE IF EXISTS archive_doomed"))
+        await connection.execute(text("""
+        CREATE TEMP TABLE archive_doomed (
+            n bigint PRIMARY KEY,
+            archive_id uuid NOT NULL,
+            archived_at timestamp NOT NULL
+        ) ON COMMIT PRESERVE ROWS
+        """))
+        try:
+            result = await connection.execute(
+                text(f"INSERT INTO archive_doomed SELECT row_number() OVER (), archive_id, archived_at FROM ({doomed}) AS doomed"),
+                {"keep_versions": self.keep_versions, "keep_days": self.keep_days}
+            )
+            await connection.commit()
+            selected = result.rowcount
+
+            statement = text(f"""
+            DELETE FROM {table} AS archive
+            USING archive_doomed AS doomed
+            WHERE doomed.n > :after AND doomed.n <= :after + :batch_size
+              AND archive.archive_id = doomed.archive_id AND archive.archived_at = doomed.archived_at
+            """)
+            total = 0
+            for after in range(0, selected, self.batch_size):
+                result = await connection.execute(statement, {"after": after, "batch_size": self.batch_size})
+                await connection.commit()
+                total += result.rowcount
+        finally:
+            await connection.rollback()
+            await connection.execute(text("DROP TABLE IF EXISTS archive_doomed"))
+            await connection.commit()
+
+        if total:
+            ARCHIVE_ROWS_REMOVED.labels(table).inc(total)
+            logger.info("Из %s удалено архивных версий: %d", table, total)
+        return total
+
+    async def _drop_partitions(self, connection: AsyncConnection, table: str) -> None:
+        now = await connection.scalar(text("SELECT now()::timestamp"))
+        current_month = _month_start(now)
+        expired_before = now - timedelta(days=self.keep_days) if self.keep_days > 0 else None
+
+        for (partition,) in (await connection.execute(PARTITIONS_SQL, {"parent": table})).all():
+            match = PARTITION_SUFFIX.search(partition)
+            if not match:
+                continue
+
+            month_end = _next_month(datetime(int(match.group(1)), int(match.group(2)), 1))
+            if month_end > current_month:
+                continue
+
+            # Без лимита по числу версий секция целиком старше срока хранения удаляется без построчного DELETE
+            expired = self.keep_versions == 0 and expired_before is not None and month_end <= expired_before
+            if not expired and await connection.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {partition})")):
+                continue
+
+            await connection.execute(text(f"DROP TABLE {partition}"))
+            await connection.commit()
+            ARCHIVE_PARTITIONS_DROPPED.labels(table).inc()
+            logger.info("Удалена секция архива %s", partition)
+
+        await connection.commit()
@@ -0,0 +1,104 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import asyncpg
+
+from src.utils.metrics import CACHE_HITS, CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+MISSING = object()
+
+caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    def __init__(self, name: str, maxsize: int, ttl: float, register: bool = True):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Инвалидация увеличивает поколение: значение, прочитанное из базы до нее, в кэш уже не попадет
+        self.generation = 0
+        self._hits_metric = CACHE_HITS.labels(name)
+        self._misses_metric = CACHE_MISSES.labels(name)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        if register:
+            caches[name] = self
+
+    def get(self, key: Hashable) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return self._miss()
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return self._miss()
+
+        self._data.move_to_end(key)
+        self._hits_metric.inc()
+        return value
+
+    def _miss(self) -> Any:
+        self._misses_metric.inc()
+        return MISSING
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self.generation:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        self.generation += 1
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+
+class CacheInvalidationListener:
+    def __init__(self, dsn: str, channel: str = INVALIDATION_CHANNEL):
+        self.dsn = dsn
+        self.channel = channel
+        self._connection: Optional[asyncpg.Connection] = None
+
+    async def start(self) -> None:
+        try:
+            self._connection = await asyncpg.connect(self.dsn)
+            await self._connection.add_listener(self.channel, self._on_notify)
+            self._connection.add_termination_listener(self._on_termination)
+        except Exception as e:
+            logger.warning("Не удалось подписаться на канал %s, кэш ограничен только TTL: %s", self.channel, e)
+            self._connection = None
+
+    async def stop(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return
+
+        cache = caches.get(data.get("table"))
+        if cache is not None:
+            cache.invalidate(data.get("key"))
+
+    def _on_termination(self, connection) -> None:
+        if self._connection is None:
+            return
+
+        logger.warning("Соединение канала %s потеряно, кэши очищены", self.channel)
+        self._connection = None
+        for cache in caches.values():
+            cache.invalidate()
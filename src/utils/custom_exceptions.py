@@ -23,6 +23,16 @@ class ForbiddenActionException(HTTPException):
         super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
 
 
+class RecordNotFoundException(HTTPException):
+    def __init__(self, detail: str = "Запись не найдена"):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class PreconditionFailedException(HTTPException):
+    def __init__(self, detail: str = "Запись была изменена другим запросом. Получите актуальную версию и повторите."):
+        super().__init__(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=detail)
+
+
 class ServerErrorException(HTTPException):
     def __init__(self, detail: str = "Некоторые проблемы на сервере"):
         super().__init__(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail)
\ No newline at end of file
@@ -55,5 +55,25 @@ custom_403_response = get_custom_error_example("Недостаточно пра
 custom_404_response_tender = get_custom_error_example("Тендер не найден.", "<объяснение, почему запрос пользователя не может быть обработан>")
 custom_404_response_bid = get_custom_error_example("Предложение не найдено.", "<объяснение, почему запрос пользователя не может быть обработан>")
 custom_404_response_org = get_custom_error_example("Организация не найдена.", "<объяснение, почему запрос пользователя не может быть обработан>")
+custom_412_response = get_custom_error_example("ETag из If-Match не совпадает с текущей версией записи.", "<объяснение, почему запрос пользователя не может быть обработан>")
 custom_422_response = get_custom_error_example("Неверный формат запроса или его параметры.", "<объяснение, почему запрос пользователя не может быть обработан>")
 custom_500_response = get_custom_error_example("Сервер не готов обрабатывать запросы,", "Некоторые проблемы на сервере")
+
+next_cursor_header = {
+    "X-Next-Cursor": {
+        "description": "Курсор следующей страницы. Отсутствует, если страница последняя.",
+        "schema": {"type": "string"}
+    }
+}
+
+etag_header = {
+    "ETag": {
+        "description": "Слабый ETag ответа. Передайте его в If-None-Match, чтобы получить 304 без тела, если данные не изменились.",
+        "schema": {"type": "string"}
+    }
+}
+
+custom_304_response = {
+    "description": "Данные не изменились с момента получения ETag из If-None-Match.",
+    "headers": etag_header,
+}
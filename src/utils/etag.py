@@ -0,0 +1,39 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+from src.utils.custom_exceptions import PreconditionFailedException
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    # Используется слабое сравнение: префикс W/ не учитывается
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == opaque for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def expected_version(if_match: Optional[str], record) -> int:
+    # Версия, прочитанная до записи, проверяется в UPDATE всегда, If-Match лишь добавляет проверку клиента.
+    # Сравнение слабое, а не строгое по RFC 7232: тег обозначает версию записи, а не байты ответа,
+    # и один и тот же тег отдают и статус, и полное представление записи
+    if if_match is not None and not etag_matches(if_match, make_etag(record.id, record.version)):
+        raise PreconditionFailedException()
+    return record.version
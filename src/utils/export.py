@@ -0,0 +1,69 @@
+import csv
+import io
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi.responses import StreamingResponse
+
+from src.config import EXPORT_BATCH_SIZE
+from src.database import async_session_maker
+from src.utils.serialization import type_adapter
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+export_responses = {
+    "description": "Поток записей: по одному JSON-объекту на строку (ndjson) или CSV с заголовком.",
+    "content": {"application/x-ndjson": {}, "text/csv": {}},
+}
+
+
+async def _stream_rows(dao, filter_by: Dict[str, Any]) -> AsyncIterator[List[Any]]:
+    # Сессия запроса закрывается до отправки тела, поэтому поток открывает собственную
+    async with async_session_maker() as session:
+        async with session.begin():
+            async for rows in dao.stream_with_filters(
+                    session, batch_size=EXPORT_BATCH_SIZE, order_by_column="name", **filter_by):
+                yield rows
+
+
+async def _ndjson_chunks(model, batches: AsyncIterator[List[Any]]) -> AsyncIterator[bytes]:
+    items_adapter, item_adapter = type_adapter(List[model]), type_adapter(model)
+    async for rows in batches:
+        items = items_adapter.validate_python(rows, from_attributes=True)
+        yield b"".join(item_adapter.dump_json(item) + b"\n" for item in items)
+
+
+async def _csv_chunks(model, batches: AsyncIterator[List[Any]]) -> AsyncIterator[bytes]:
+    items_adapter = type_adapter(List[model])
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(model.model_fields))
+    writer.writeheader()
+    async for rows in batches:
+        writer.writerows(item.model_dump(mode="json") for item in items_adapter.validate_python(rows, from_attributes=True))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(dao, model, export_format: ExportFormat, filename: str, **filter_by) -> StreamingResponse:
+    batches = _stream_rows(dao, filter_by)
+    if export_format == ExportFormat.csv:
+        chunks = _csv_chunks(model, batches)
+    else:
+        chunks = _ndjson_chunks(model, batches)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
@@ -0,0 +1,216 @@
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from prometheus_client import Counter, Gauge, Histogram, CollectorRegistry, generate_latest, multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+LATENCY_BUCKETS = (0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Количество запросов в обработке",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Время выполнения SQL-запроса",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors",
+    "Количество SQL-запросов, завершившихся ошибкой",
+)
+DB_REQUEST_QUERIES = Histogram(
+    "db_request_queries",
+    "Количество SQL-запросов за один HTTP-запрос",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21, 50, 100),
+)
+DB_REQUEST_QUERY_DURATION = Histogram(
+    "db_request_query_duration_seconds",
+    "Суммарное время SQL-запросов за один HTTP-запрос",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Метка pool разделяет основную базу (primary) и реплику для чтения (replica)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Максимальное число соединений пула (pool_size + max_overflow)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Количество соединений, выданных из пула",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts",
+    "Количество выдач соединений из пула",
+    ["pool"],
+)
+DB_POOL_CONNECTIONS_OPENED = Counter(
+    "db_pool_connections_opened",
+    "Количество новых соединений с базой",
+    ["pool"],
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Время ожидания соединения из пула",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts",
+    "Количество превышений pool_timeout при получении соединения",
+    ["pool"],
+)
+
+CACHE_HITS = Counter(
+    "cache_hits",
+    "Количество попаданий в кэш",
+    ["cache"],
+)
+CACHE_MISSES = Counter(
+    "cache_misses",
+    "Количество промахов кэша, включая истекшие записи",
+    ["cache"],
+)
+
+ARCHIVE_ROWS_REMOVED = Counter(
+    "archive_rows_removed",
+    "Количество архивных версий, удаленных по политике хранения",
+    ["table"],
+)
+ARCHIVE_PARTITIONS_DROPPED = Counter(
+    "archive_partitions_dropped",
+    "Количество удаленных секций архивных таблиц",
+    ["table"],
+)
+
+
+@dataclass
+class RequestDBStats:
+    queries: int = 0
+    duration: float = 0.0
+    statements: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.queries += 1
+        self.duration += duration
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+def _operation(statement: str) -> str:
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return operation if operation in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context._metrics_started
+    DB_QUERY_DURATION.labels(_operation(statement)).observe(duration)
+
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def _handle_error(exception_context):
+    DB_QUERY_ERRORS.inc()
+    context = exception_context.execution_context
+    stats = request_db_stats.get()
+    if stats is not None and context is not None and hasattr(context, "_metrics_started"):
+        stats.record(exception_context.statement, time.perf_counter() - context._metrics_started)
+
+
+def instrument_engine(engine: Engine, pool_size: int, pool: str) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+    opened, checkouts, checked_out = (
+        DB_POOL_CONNECTIONS_OPENED.labels(pool), DB_POOL_CHECKOUTS.labels(pool), DB_POOL_CHECKED_OUT.labels(pool)
+    )
+    event.listen(engine.pool, "connect", lambda *_: opened.inc())
+    event.listen(engine.pool, "checkout", lambda *_: (checkouts.inc(), checked_out.inc()))
+    event.listen(engine.pool, "checkin", lambda *_: checked_out.dec())
+    DB_POOL_SIZE.labels(pool).set(pool_size)
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Счетчик из внешнего контекста (count_queries в тестах) не подменяется
+        stats = request_db_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestDBStats()
+            token = request_db_stats.set(stats)
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            in_progress.dec()
+            if token is not None:
+                request_db_stats.reset(token)
+
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            HTTP_REQUEST_DURATION.labels(method, route_path, str(status_code)).observe(duration)
+            DB_REQUEST_QUERIES.labels(route_path).observe(stats.queries)
+            DB_REQUEST_QUERY_DURATION.labels(route_path).observe(stats.duration)
+
+
+def render_metrics() -> bytes:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def mark_worker_dead() -> None:
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
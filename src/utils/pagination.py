@@ -0,0 +1,27 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException
+
+
+def encode_cursor(value: Any, row_id: uuid.UUID) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif hasattr(value, "value"):
+        value = value.value
+    raw = json.dumps([value, str(row_id)], ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, python_type: Optional[type] = None) -> Tuple[Any, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if python_type is datetime and value is not None:
+            value = datetime.fromisoformat(value)
+        return value, uuid.UUID(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Некорректный курсор пагинации")
@@ -0,0 +1,96 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from starlette.datastructures import MutableHeaders
+
+from src.utils.metrics import RequestDBStats, request_db_stats
+
+logger = logging.getLogger(__name__)
+
+
+def server_timing_header(stats: RequestDBStats, total: float) -> str:
+    return f'db;dur={stats.duration * 1000:.2f};desc="{stats.queries} queries", app;dur={total * 1000:.2f}'
+
+
+def parse_server_timing(value: str) -> Dict[str, Dict[str, str]]:
+    metrics = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        name, *params = (param.strip() for param in entry.split(";"))
+        metrics[name] = {}
+        for param in params:
+            key, _, param_value = param.partition("=")
+            metrics[name][key] = param_value.strip('"')
+    return metrics
+
+
+def queries_from_headers(headers) -> Optional[int]:
+    db = parse_server_timing(headers.get("Server-Timing", "")).get("db")
+    if not db or "desc" not in db:
+        return None
+    return int(db["desc"].split()[0])
+
+
+def assert_query_budget(endpoint: str, stats: RequestDBStats, budgets: Dict[str, int]) -> int:
+    budget = budgets.get(endpoint)
+    if budget is None:
+        raise AssertionError(f"{endpoint}: бюджет SQL-запросов не задан")
+    if stats.queries > budget:
+        raise AssertionError(f"{endpoint}: {stats.queries} SQL-запросов при бюджете {budget}")
+    return stats.queries
+
+
+@contextmanager
+def count_queries() -> Iterator[RequestDBStats]:
+    stats = RequestDBStats()
+    token = request_db_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        request_db_stats.reset(token)
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app, budget: int, repeat_threshold: int, server_timing: bool = False):
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = request_db_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestDBStats()
+            token = request_db_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and self.server_timing:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing_header(stats, time.perf_counter() - started))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if token is not None:
+                request_db_stats.reset(token)
+            self._check(scope, stats)
+
+    def _check(self, scope, stats: RequestDBStats) -> None:
+        route = scope.get("route")
+        endpoint = f"{scope['method']} {route.path if route is not None else scope['path']}"
+
+        if stats.queries > self.budget:
+            logger.warning("%s: %d SQL-запросов при бюджете %d", endpoint, stats.queries, self.budget)
+
+        for statement, count in stats.statements.items():
+            if count >= self.repeat_threshold:
+                logger.warning("%s: возможный N+1, запрос выполнен %d раз: %.200s",
+                               endpoint, count, " ".join(statement.split()))
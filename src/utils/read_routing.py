@@ -0,0 +1,39 @@
+import time
+from typing import Mapping, Optional
+
+from starlette.datastructures import MutableHeaders
+
+RECENT_WRITE_COOKIE = "recent_write"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def has_recent_write(cookies: Mapping[str, str], window: float, now: Optional[float] = None) -> bool:
+    try:
+        written_at = float(cookies[RECENT_WRITE_COOKIE])
+    except (KeyError, ValueError):
+        return False
+    return 0 <= (now or time.time()) - written_at < window
+
+
+class RecentWriteMiddleware:
+    def __init__(self, app, window: float):
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            # Успешная запись помечает клиента, и его чтения в течение окна идут в основную базу
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{RECENT_WRITE_COOKIE}={time.time():.3f}; Max-Age={int(self.window) or 1}; "
+                    f"Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,174 @@
+import hashlib
+import logging
+import marshal
+import os
+import shutil
+import time
+import uuid
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+from fastapi import Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.utils.cache import MISSING, TTLCache, caches
+from src.utils.metrics import CACHE_HITS, CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+CACHED_HEADERS = ("etag", "x-next-cursor")
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+
+    def to_response(self) -> Response:
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
+
+
+class NullCache:
+    generation = 0
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def get(self, key: Hashable) -> Any:
+        return MISSING
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        pass
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        pass
+
+
+class SharedMemoryCache:
+    # Записи лежат файлами в tmpfs и видны всем воркерам на машине; marshal, а не pickle, чтобы не исполнять код из файла.
+    # Поколение тоже общее: файл generation хранит имя каталога текущих записей, и ответ, прочитанный до очистки
+    # в любом воркере, пишется в каталог старого поколения, который уже никто не читает
+    def __init__(self, name: str, directory: str, maxsize: int, ttl: float):
+        self.name = name
+        self.directory = os.path.join(directory, name)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._hits_metric = CACHE_HITS.labels(name)
+        self._misses_metric = CACHE_MISSES.labels(name)
+
+    @property
+    def generation(self) -> str:
+        try:
+            with open(os.path.join(self.directory, "generation")) as file:
+                return file.read()
+        except FileNotFoundError:
+            return self._rotate()
+
+    def _rotate(self) -> str:
+        # Новое поколение записывается целиком через os.replace; при гонке двух воркеров побеждает последний
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        temporary = os.path.join(self.directory, f".{os.getpid()}.{uuid.uuid4().hex}")
+        with open(temporary, "w") as file:
+            file.write(uuid.uuid4().hex)
+        os.replace(temporary, os.path.join(self.directory, "generation"))
+        with open(os.path.join(self.directory, "generation")) as file:
+            return file.read()
+
+    def _path(self, key: Hashable, generation: str) -> str:
+        return os.path.join(self.directory, generation, hashlib.sha1(repr(key).encode()).hexdigest())
+
+    def get(self, key: Hashable) -> Any:
+        try:
+            with open(self._path(key, self.generation), "rb") as file:
+                expires_at, value = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return self._miss()
+
+        if expires_at < time.time():
+            return self._miss()
+
+        self._hits_metric.inc()
+        return value
+
+    def _miss(self) -> Any:
+        self._misses_metric.inc()
+        return MISSING
+
+    def set(self, key: Hashable, value: Any, generation: Optional[str] = None) -> None:
+        try:
+            current = self.generation
+            if generation is None:
+                generation = current
+            elif generation != current:
+                return
+
+            directory = os.path.join(self.directory, generation)
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            if len(os.listdir(directory)) >= self.maxsize:
+                self.invalidate()
+                return
+
+            # Запись во временный файл и os.replace: читатель видит либо старую запись, либо новую целиком
+            temporary = os.path.join(directory, f".{os.getpid()}.{uuid.uuid4().hex}")
+            with open(temporary, "wb") as file:
+                marshal.dump((time.time() + self.ttl, value), file)
+            os.replace(temporary, self._path(key, generation))
+        except OSError as e:
+            logger.warning("Не удалось записать в кэш %s: %s", self.directory, e)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        try:
+            if key is not None:
+                os.remove(self._path(key, self.generation))
+                return
+
+            # Читатели переключаются на новое поколение сразу, каталоги старых удаляются следом
+            current = self._rotate()
+            for entry in os.scandir(self.directory):
+                if entry.is_dir() and entry.name != current:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Не удалось очистить кэш %s: %s", self.directory, e)
+
+
+class ResponseCache:
+    def __init__(self, name: str, backend):
+        self.name = name
+        self.backend = backend
+        caches[name] = self
+
+    @property
+    def generation(self):
+        # Поколение хранится в backend: для shm оно общее для всех воркеров
+        return self.backend.generation
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        value = self.backend.get(key)
+        if value is MISSING:
+            return None
+        return CachedResponse(*value)
+
+    def set(self, key: Hashable, response: Response, generation) -> None:
+        # Ответ, прочитанный до инвалидации, в кэш уже не попадет
+        headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+        self.backend.set(key, (bytes(response.body), headers), generation)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        self.backend.invalidate(key)
+
+    def invalidate_after_commit(self, session: AsyncSession) -> None:
+        # До коммита параллельный GET может снова закэшировать старый снимок, поэтому очистка после него
+        event.listen(session.sync_session, "after_commit", lambda _: self.invalidate(), once=True)
+
+
+def create_response_cache(name: str, backend: str, maxsize: int, ttl: float, directory: str) -> ResponseCache:
+    if backend == "memory":
+        store = TTLCache(name, maxsize=maxsize, ttl=ttl, register=False)
+    elif backend == "shm":
+        store = SharedMemoryCache(name, directory, maxsize=maxsize, ttl=ttl)
+    elif backend == "none":
+        store = NullCache(name)
+    else:
+        raise ValueError(f"Неизвестный backend кэша ответов: {backend}")
+    return ResponseCache(name, store)
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def json_response(model: Any, content: Any, response: Optional[Response] = None) -> Response:
+    # Одна валидация в pydantic-core и сериализация в JSON без jsonable_encoder и повторной проверки по response_model
+    adapter = type_adapter(model)
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+    headers = None
+    if response is not None:
+        headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return Response(content=body, media_type="application/json", headers=headers)
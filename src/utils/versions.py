@@ -0,0 +1,26 @@
+from typing import Any, Iterable, List
+
+from pydantic import BaseModel, Field
+
+
+class FieldChange(BaseModel):
+    field: str = Field(..., example="name")
+    old: Any = Field(None, example="Доставка товары Казань - Москва")
+    new: Any = Field(None, example="Доставка товаров Казань - Москва")
+
+class VersionDiff(BaseModel):
+    version_from: int = Field(..., example=1)
+    version_to: int = Field(..., example=3)
+    changes: List[FieldChange]
+
+
+def diff_versions(old, new, fields: Iterable[str]) -> VersionDiff:
+    return VersionDiff(
+        version_from=old.version,
+        version_to=new.version,
+        changes=[
+            FieldChange(field=field, old=getattr(old, field), new=getattr(new, field))
+            for field in fields
+            if getattr(old, field) != getattr(new, field)
+        ]
+    )
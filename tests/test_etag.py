@@ -0,0 +1,34 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.custom_exceptions import PreconditionFailedException
+from src.utils.etag import etag_matches, expected_version, make_etag
+
+RECORD = SimpleNamespace(id=uuid.UUID("00000000-0000-0000-0000-000000000001"), version=3)
+
+
+def test_etag_matches_weakly():
+    etag = make_etag(RECORD.id, RECORD.version)
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag[2:], etag)
+    assert etag_matches(f'W/"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_expected_version_without_if_match_returns_read_version():
+    assert expected_version(None, RECORD) == 3
+
+
+def test_expected_version_with_matching_if_match():
+    assert expected_version(make_etag(RECORD.id, RECORD.version), RECORD) == 3
+
+
+def test_expected_version_with_stale_if_match():
+    with pytest.raises(PreconditionFailedException) as error:
+        expected_version(make_etag(RECORD.id, RECORD.version - 1), RECORD)
+    assert error.value.status_code == 412
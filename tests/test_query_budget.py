@@ -0,0 +1,145 @@
+"""Бюджет SQL-запросов эндпоинтов тендеров и предложений.
+
+Чистые помощники из src.utils.query_budget проверяются без базы. Эндпоинты вызываются через ASGI
+внутри count_queries() с холодными кэшами, GET-запросы с устаревшим If-None-Match, чтобы пройти
+и ветку с отпечатком. Для них нужна база из переменных POSTGRES_*: тест засевает ее небольшим
+набором seed_* данных, без базы эти проверки пропускаются.
+"""
+import asyncio
+import random
+from typing import Dict, Tuple
+
+import asyncpg
+import httpx
+import pytest
+
+from benchmarks.scenarios import SCENARIOS, SeedData
+from benchmarks.seed import Volumes, seed_database
+from src.config import POSTGRES_DSN
+from src.utils.cache import caches
+from src.utils.metrics import RequestDBStats
+from src.utils.query_budget import (
+    assert_query_budget,
+    count_queries,
+    parse_server_timing,
+    queries_from_headers,
+    server_timing_header,
+)
+
+# Верхняя граница при холодных кэшах, включая ветки с If-None-Match; COPY из импорта идет мимо курсора и не считается
+ENDPOINT_BUDGETS: Dict[str, int] = {
+    "GET /tenders": 2,
+    "POST /tenders/new": 4,
+    "POST /tenders/bulk": 3,
+    "PATCH /tenders/bulk/status": 3,
+    "POST /tenders/import": 4,
+    "GET /tenders/my": 4,
+    "GET /tenders/export": 4,
+    "GET /tenders/{tender_id}/status": 1,
+    "GET /tenders/{tender_id}/stats": 2,
+    "PATCH /tenders/{tender_id}/status": 3,
+    "PATCH /tenders/{tender_id}/edit": 3,
+    "PUT /tenders/{tender_id}/rollback/{version}": 4,
+    "GET /tenders/{tender_id}/versions": 2,
+    "GET /tenders/{tender_id}/versions/diff": 3,
+    "POST /bids/new": 3,
+    "POST /bids/bulk": 2,
+    "GET /bids/my": 4,
+    "GET /bids/export": 4,
+    "GET /bids/{tender_id}/list": 3,
+    "GET /bids/{bid_id}/status": 1,
+    "PATCH /bids/{bid_id}/status": 3,
+    "PATCH /bids/{bid_id}/edit": 3,
+    "PUT /bids/{bid_id}/rollback/{version}": 4,
+    "PATCH /bids/{bid_id}/submit_decision": 2,
+    "POST /bids/{bid_id}/feedback": 2,
+    "GET /bids/{tender_id}/reviews": 4,
+    "GET /bids/{bid_id}/versions": 2,
+    "GET /bids/{bid_id}/versions/diff": 3,
+}
+
+VOLUMES = Volumes(employees=50, organizations=10, tenders=200, bids=500, feedbacks=100, versions=5)
+ATTEMPTS = 10
+
+# Поиск по q идет тем же маршрутом GET /tenders, поэтому сценарий с ним не дублируется
+BUILDERS = {scenario.endpoint: scenario.build for scenario in SCENARIOS if "?" not in scenario.endpoint}
+
+
+def test_parse_server_timing():
+    metrics = parse_server_timing('db;dur=1.50;desc="3 queries", app;dur=4.00')
+    assert metrics == {"db": {"dur": "1.50", "desc": "3 queries"}, "app": {"dur": "4.00"}}
+    assert parse_server_timing("") == {}
+
+
+def test_queries_from_headers():
+    stats = RequestDBStats(queries=3, duration=0.0015)
+    assert queries_from_headers({"Server-Timing": server_timing_header(stats, 0.004)}) == 3
+    assert queries_from_headers({"Server-Timing": "app;dur=4.00"}) is None
+    assert queries_from_headers({}) is None
+
+
+def test_assert_query_budget():
+    budgets = {"GET /tenders": 2}
+    assert assert_query_budget("GET /tenders", RequestDBStats(queries=2), budgets) == 2
+    with pytest.raises(AssertionError, match="3 SQL-запросов при бюджете 2"):
+        assert_query_budget("GET /tenders", RequestDBStats(queries=3), budgets)
+    with pytest.raises(AssertionError, match="не задан"):
+        assert_query_budget("GET /bids/my", RequestDBStats(queries=0), budgets)
+
+
+def test_every_endpoint_has_budget():
+    assert set(BUILDERS) == set(ENDPOINT_BUDGETS)
+
+
+async def _measure() -> Dict[str, Tuple[int, RequestDBStats]]:
+    from src.database import engine, read_engine
+    from src.main import app
+
+    await seed_database(POSTGRES_DSN, VOLUMES, reset=True)
+
+    data = SeedData(VOLUMES)
+    rng = random.Random(0)
+    measured = {}
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test/api") as client:
+                for endpoint, build in BUILDERS.items():
+                    # Ответ 4xx от случайных данных (тот же статус, нет версии) не проходит весь путь, поэтому повтор
+                    for _ in range(ATTEMPTS):
+                        call = build(data, rng)
+                        headers = {"If-None-Match": '"stale"'} if call.method == "GET" else {}
+                        for cache in caches.values():
+                            cache.invalidate()
+                        with count_queries() as stats:
+                            response = await client.request(call.method, call.path, params=call.params,
+                                                            json=call.json, content=call.content, headers=headers)
+                        measured[endpoint] = (response.status_code, stats)
+                        if response.status_code < 300:
+                            break
+    finally:
+        for disposed in {engine, read_engine}:
+            await disposed.dispose()
+    return measured
+
+
+@pytest.fixture(scope="module")
+def measured() -> Dict[str, Tuple[int, RequestDBStats]]:
+    async def reachable() -> bool:
+        try:
+            connection = await asyncpg.connect(POSTGRES_DSN, timeout=5)
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, ValueError):
+            return False
+        await connection.close()
+        return True
+
+    if not asyncio.run(reachable()):
+        pytest.skip("PostgreSQL из переменных POSTGRES_* недоступен")
+    return asyncio.run(_measure())
+
+
+@pytest.mark.parametrize("endpoint", sorted(ENDPOINT_BUDGETS))
+def test_query_budget(measured, endpoint):
+    status_code, stats = measured[endpoint]
+    assert status_code < 300, f"{endpoint}: ответ {status_code}"
+    assert_query_budget(endpoint, stats, ENDPOINT_BUDGETS)